@@ -0,0 +1,47 @@
+"""
+Frame Regulator - Drift-free frame pacing for display loops
+Shared by the LCD scripts and the OLED loading animation
+"""
+import time
+
+# Shortest period; a zero interval (e.g. --speed 0) runs this fast, not flat out
+MIN_PERIOD = 0.01
+
+
+class FrameRegulator:
+    """Pace a loop to a fixed frame period (seconds) on a monotonic schedule
+
+    Each wait sleeps only until the next deadline, so time spent drawing
+    counts toward the frame instead of adding to it. When a frame runs
+    more than one period late the schedule resyncs (dropping the missed
+    frames) rather than bursting to catch up.
+    """
+
+    def __init__(self, period):
+        self.period = max(period, MIN_PERIOD)
+        self._deadline = None
+
+    def reset(self):
+        """Restart the schedule; the next wait is a full period from now"""
+        self._deadline = None
+
+    def _slack(self, period):
+        """Advance the deadline and return how long to sleep"""
+        if period is None:
+            period = self.period
+        now = time.monotonic()
+        deadline = (self._deadline or now) + period
+        if now - deadline > period:
+            # Too far behind - skip the missed frames instead of bursting
+            deadline = now
+        self._deadline = deadline
+        return max(0.0, deadline - now)
+
+    def wait(self, period=None):
+        """Block until the next frame (period overrides one interval)"""
+        time.sleep(self._slack(period))
+
+    async def wait_async(self, period=None):
+        """Await the next frame without blocking the event loop"""
+        import asyncio  # Already loaded by any caller; sync users skip it
+        await asyncio.sleep(self._slack(period))
@@ -3,10 +3,12 @@
 IP Display - Shows Pi's IP address and animated special characters
 """
 
-import time
+import asyncio
 import random
-import socket
-import subprocess
+
+from frame_regulator import FrameRegulator
+from ip_lookup import get_ip_address
+from pcf8574_writer import open_shadow_rows
 try:
     from RPLCD.i2c import CharLCD
     HAS_LCD = True
@@ -14,6 +16,25 @@ except ImportError:
     print("LCD libraries not found. Install with: pip install RPLCD")
     HAS_LCD = False
 
+# Custom character slots (see create_custom_chars)
+DOT_CHAR = 0
+BAR_CHAR = 1
+
+# Custom char 0: Solid dot (degree symbol alternative)
+DOT_BITMAP = bytes((
+    0b00000,
+    0b01110,
+    0b01110,
+    0b01110,
+    0b00000,
+    0b00000,
+    0b00000,
+    0b00000,
+))
+
+# Custom char 1: Double vertical bar
+BAR_BITMAP = bytes((0b01010,) * 8)
+
 class IPDisplay:
     def __init__(self, i2c_addr=0x3f, cols=16, rows=2):
         self.cols = cols
@@ -30,65 +51,34 @@ class IPDisplay:
                 self.has_display = False
         else:
             self.has_display = False
+        
+        # Row shadow: sends only changed cells, batched over I2C when possible
+        self._screen = open_shadow_rows(self.lcd, i2c_addr, cols, rows) if self.has_display else None
             
         self.running = True
         self.scroll_pos = 0
         self.dot_positions = [random.randint(0, cols-1) for _ in range(3)]
+        self.frame_interval = 0.5  # Update every half second
+        self.ip_refresh_interval = 10.0
+        self._cached_ip = None  # Refreshed every ip_refresh_interval by _refresh_ip
+        
+        # Dot line frame buffer, reused every frame
+        self._blank_row = b' ' * cols
+        self._dot_buf = bytearray(self._blank_row)
+        self._dot_moves = []  # Refilled in bulk by _animate
         
         # Create custom characters
         if self.has_display:
             self.create_custom_chars()
     
     def create_custom_chars(self):
-        """Create custom LCD characters"""
-        # Custom char 0: Solid dot (degree symbol alternative)
-        dot_char = (
-            0b00000,
-            0b01110,
-            0b01110,
-            0b01110,
-            0b00000,
-            0b00000,
-            0b00000,
-            0b00000,
-        )
-        
-        # Custom char 1: Double vertical bar
-        double_bar = (
-            0b01010,
-            0b01010,
-            0b01010,
-            0b01010,
-            0b01010,
-            0b01010,
-            0b01010,
-            0b01010,
-        )
-        
-        self.lcd.create_char(0, dot_char)
-        self.lcd.create_char(1, double_bar)
+        """Upload the custom LCD characters"""
+        self.lcd.create_char(DOT_CHAR, DOT_BITMAP)
+        self.lcd.create_char(BAR_CHAR, BAR_BITMAP)
         
     def get_ip_address(self):
         """Get Pi's IP address"""
-        try:
-            # Try to get wlan0 first (WiFi)
-            result = subprocess.run(['hostname', '-I'], capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout.strip():
-                # Get first IP address
-                ip = result.stdout.strip().split()[0]
-                return ip
-        except:
-            pass
-            
-        try:
-            # Fallback method
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except:
-            return "No Network"
+        return get_ip_address() or "No Network"
     
     def display_text(self, line1="", line2=""):
         """Display text on LCD"""
@@ -96,15 +86,7 @@ class IPDisplay:
             print(f"LCD: '{line1}' / '{line2}'")
             return
             
-        # Truncate to display width
-        line1 = line1[:self.cols].ljust(self.cols)
-        line2 = line2[:self.cols].ljust(self.cols)
-        
-        self.lcd.cursor_pos = (0, 0)
-        self.lcd.write_string(line1)
-        if self.rows > 1:
-            self.lcd.cursor_pos = (1, 0)
-            self.lcd.write_string(line2)
+        self._screen.write_lines(line1, line2)
     
     def run(self):
         """Main display loop"""
@@ -112,32 +94,48 @@ class IPDisplay:
         print("Press Ctrl+C to stop")
         
         try:
-            while self.running:
-                # Get current IP
-                ip = self.get_ip_address()
-                
-                # Create scrolling bars with floating dots
-                bar_line = chr(1) * self.cols  # Fill with custom double bars
-                
-                # Create line with floating dots
-                dot_line = [' '] * self.cols
-                for pos in self.dot_positions:
-                    dot_line[pos] = chr(0)  # Custom dot character
-                
-                # Move dots randomly
-                for i in range(len(self.dot_positions)):
-                    move = random.choice([-1, 0, 1])
-                    self.dot_positions[i] = (self.dot_positions[i] + move) % self.cols
-                
-                # Display IP and animated line
-                self.display_text(ip, ''.join(dot_line))
-                
-                time.sleep(0.5)  # Update every half second
-                
+            asyncio.run(self._run())
         except KeyboardInterrupt:
             print("\nShutting down...")
             if self.has_display:
                 self.lcd.clear()
+                self._screen.mark_cleared()
+
+    async def _run(self):
+        """Run IP refresh and animation concurrently"""
+        self._cached_ip = self.get_ip_address()
+        await asyncio.gather(self._refresh_ip(), self._animate())
+
+    async def _refresh_ip(self):
+        """Refresh the cached IP address off the animation path"""
+        loop = asyncio.get_running_loop()
+        while self.running:
+            await asyncio.sleep(self.ip_refresh_interval)
+            self._cached_ip = await loop.run_in_executor(None, self.get_ip_address)
+
+    async def _animate(self):
+        """Draw the IP line and floating dots"""
+        dot_buf = self._dot_buf
+        blank_row = self._blank_row
+        regulator = FrameRegulator(self.frame_interval)
+        
+        while self.running:
+            # Redraw the floating dots into the reused buffer
+            dot_buf[:] = blank_row
+            for pos in self.dot_positions:
+                dot_buf[pos] = DOT_CHAR  # Custom dot character
+            
+            # Move dots randomly, drawing from a prefilled buffer of moves
+            moves = self._dot_moves
+            if len(moves) < len(self.dot_positions):
+                moves = self._dot_moves = random.choices((-1, 0, 1), k=4096)
+            for i in range(len(self.dot_positions)):
+                self.dot_positions[i] = (self.dot_positions[i] + moves.pop()) % self.cols
+            
+            # Display IP and animated line
+            self.display_text(self._cached_ip, dot_buf.decode('latin-1'))
+            
+            await regulator.wait_async()
 
 def main():
     display = IPDisplay(i2c_addr=0x3f, cols=16, rows=2)
@@ -0,0 +1,41 @@
+"""
+IP Lookup - Local IPv4 address without forking `hostname -I`
+Shared by the IP display and the voice assistant's "show IP" command
+"""
+import fcntl
+import socket
+import struct
+
+SIOCGIFADDR = 0x8915  # Linux ioctl: get interface IPv4 address
+
+
+def get_ip_address():
+    """Return the Pi's IPv4 address, or None if no interface has one"""
+    try:
+        # Connecting a UDP socket sends nothing; it just picks the
+        # outbound interface, whose address is the one we want
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(('10.255.255.255', 1))
+            return s.getsockname()[0]
+    except OSError:
+        pass  # No route (e.g. no default gateway); ask the interfaces
+
+    return _scan_interfaces()
+
+
+def _scan_interfaces():
+    """First non-loopback interface address, same as `hostname -I`"""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            for _, name in socket.if_nameindex():
+                if name == 'lo':
+                    continue
+                try:
+                    packed = fcntl.ioctl(s.fileno(), SIOCGIFADDR,
+                                         struct.pack('256s', name[:15].encode()))
+                except OSError:
+                    continue  # Interface has no IPv4 address
+                return socket.inet_ntoa(packed[20:24])
+    except OSError:
+        pass
+    return None
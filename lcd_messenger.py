@@ -3,12 +3,20 @@
 LCD Messenger - CLI tool for displaying scrolling messages on LCD
 """
 
+import asyncio
 import time
 import sys
 import argparse
 import signal
+import threading
+import queue
+from collections import deque
+from itertools import chain, islice, repeat
 from typing import Optional
 
+from frame_regulator import FrameRegulator
+from pcf8574_writer import open_shadow_rows
+
 try:
     from RPLCD.i2c import CharLCD
     HAS_LCD = True
@@ -34,95 +42,152 @@ class LCDMessenger:
         else:
             self.has_display = False
         
+        # Row shadow: sends only changed cells, batched over I2C when possible
+        self._screen = open_shadow_rows(self.lcd, i2c_addr, cols, rows) if self.has_display else None
+        
+        # A single display thread owns the LCD; producers hand it frames
+        # through a one-slot queue so the newest frame always wins
+        self._lcd_lock = threading.RLock()  # Re-entrant: signal handler may clear mid-write
+        self._frame_q = queue.Queue(maxsize=1)
+        threading.Thread(target=self._display_worker, daemon=True).start()
+        
         # Set up signal handlers for clean exit
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
     
     def display_text(self, line1="", line2=""):
         """Display text on LCD"""
-        if not self.has_display:
-            print(f"LCD: '{line1}' | '{line2}'")
-            return
-            
-        # Truncate to display width
-        line1 = line1[:self.cols].ljust(self.cols)
-        line2 = line2[:self.cols].ljust(self.cols)
+        with self._lcd_lock:
+            if not self.has_display:
+                print(f"LCD: '{line1}' | '{line2}'")
+                return
+                
+            self._screen.write_lines(line1, line2)
+    
+    def clear(self):
+        """Clear the LCD"""
+        with self._lcd_lock:
+            if self.has_display:
+                self.lcd.clear()
+                self._screen.mark_cleared()
+            else:
+                print("LCD: [CLEARED]")
+    
+    def _submit_frame(self, line1="", line2=""):
+        """Queue a frame for the display thread, replacing any unsent one
         
-        self.lcd.cursor_pos = (0, 0)
-        self.lcd.write_string(line1)
-        if self.rows > 1:
-            self.lcd.cursor_pos = (1, 0)
-            self.lcd.write_string(line2)
+        Pass line1=None to queue a clear instead of text.
+        """
+        frame = (line1, line2)
+        while True:
+            try:
+                self._frame_q.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self._frame_q.get_nowait()  # Drop the stale frame
+                except queue.Empty:
+                    pass
+    
+    def _display_worker(self):
+        """Display thread: write the newest queued frame to the LCD"""
+        while True:
+            line1, line2 = self._frame_q.get()
+            # Check running under the lock: cleanup() clears under it too, so
+            # a frame dequeued just before shutdown can't land after the clear
+            with self._lcd_lock:
+                if not self.running:
+                    continue
+                if line1 is None:
+                    self.clear()
+                else:
+                    self.display_text(line1, line2)
     
     def scroll_message(self, message, speed=0.3, line=1):
         """Scroll a message horizontally across the specified line"""
         if not message:
             return
         
-        # Pad message with spaces for smooth scrolling
-        padded_message = " " * self.cols + message + " " * self.cols
-        
         print(f"Scrolling message on line {line}: '{message}'")
         print("Press Ctrl+C to stop")
         
         try:
-            while self.running:
-                for i in range(len(padded_message) - self.cols + 1):
-                    if not self.running:
-                        break
-                        
-                    display_text = padded_message[i:i + self.cols]
-                    
-                    if line == 1:
-                        self.display_text(display_text, "")
-                    else:
-                        self.display_text("", display_text)
-                    
-                    time.sleep(speed)
-                
-                # Brief pause before repeating
-                time.sleep(1)
-                
+            asyncio.run(self._scroll_message(message, speed, line))
         except KeyboardInterrupt:
             self.cleanup()
     
+    async def _scroll_message(self, message, speed, line):
+        """Coroutine that scrolls a single-line message until stopped"""
+        # Build every window once; the repeat loop just replays them
+        windows = list(self._scroll_windows(message))
+        if line == 1:
+            frames = [(window, "") for window in windows]
+        else:
+            frames = [("", window) for window in windows]
+        regulator = FrameRegulator(speed)
+        
+        while self.running:
+            for display_line1, display_line2 in frames:
+                if not self.running:
+                    break
+                    
+                self._submit_frame(display_line1, display_line2)
+                await regulator.wait_async()
+            
+            # Brief pause before repeating
+            await regulator.wait_async(1)
+    
+    def _scroll_windows(self, message, steps=None):
+        """Yield display-width windows of message sliding in from the right
+        
+        A fixed-length deque acts as the ring buffer: each step pushes one
+        character in and the oldest falls off, so no padded copy of the
+        message is ever built.
+        """
+        if steps is None:
+            steps = len(message) + self.cols
+        window = deque(" " * self.cols, maxlen=self.cols)
+        yield "".join(window)
+        for char in islice(chain(message, repeat(" ")), steps):
+            window.append(char)
+            yield "".join(window)
+    
     def scroll_two_lines(self, line1_msg, line2_msg, speed=0.3):
         """Scroll messages on both lines simultaneously"""
         if not line1_msg and not line2_msg:
             return
         
-        # Pad both messages
-        padded_line1 = " " * self.cols + (line1_msg or "") + " " * self.cols
-        padded_line2 = " " * self.cols + (line2_msg or "") + " " * self.cols
-        
-        # Make them the same length for synchronized scrolling
-        max_len = max(len(padded_line1), len(padded_line2))
-        padded_line1 = padded_line1.ljust(max_len)
-        padded_line2 = padded_line2.ljust(max_len)
-        
         print(f"Scrolling two-line message:")
         print(f"  Line 1: '{line1_msg}'")
         print(f"  Line 2: '{line2_msg}'")
         print("Press Ctrl+C to stop")
         
         try:
-            while self.running:
-                for i in range(max_len - self.cols + 1):
-                    if not self.running:
-                        break
-                        
-                    display_line1 = padded_line1[i:i + self.cols]
-                    display_line2 = padded_line2[i:i + self.cols]
-                    
-                    self.display_text(display_line1, display_line2)
-                    time.sleep(speed)
-                
-                # Brief pause before repeating
-                time.sleep(1)
-                
+            asyncio.run(self._scroll_two_lines(line1_msg, line2_msg, speed))
         except KeyboardInterrupt:
             self.cleanup()
     
+    async def _scroll_two_lines(self, line1_msg, line2_msg, speed):
+        """Coroutine that scrolls both lines in sync until stopped"""
+        # Run both lines for the same number of steps so they stay in sync
+        steps = max(len(line1_msg or ""), len(line2_msg or "")) + self.cols
+        
+        # Build every window pair once; the repeat loop just replays them
+        frames = list(zip(self._scroll_windows(line1_msg or "", steps),
+                          self._scroll_windows(line2_msg or "", steps)))
+        regulator = FrameRegulator(speed)
+        
+        while self.running:
+            for display_line1, display_line2 in frames:
+                if not self.running:
+                    break
+                    
+                self._submit_frame(display_line1, display_line2)
+                await regulator.wait_async()
+            
+            # Brief pause before repeating
+            await regulator.wait_async(1)
+    
     def static_display(self, line1="", line2=""):
         """Display static text until interrupted"""
         print(f"Displaying static text:")
@@ -150,44 +215,84 @@ class LCDMessenger:
         print("  'quit' or Ctrl+C to exit")
         print()
         
+        try:
+            asyncio.run(self._interactive())
+        except (KeyboardInterrupt, EOFError):
+            pass
+        finally:
+            self.cleanup()
+    
+    async def _interactive(self):
+        """Read commands while the current message keeps scrolling"""
+        scroller = None
+        
+        def stop_scroller():
+            if scroller is not None:
+                scroller.cancel()
+        
         try:
             while self.running:
-                user_input = input("Message: ").strip()
+                user_input = (await self._read_input("Message: ")).strip()
                 
                 if not user_input or user_input.lower() in ['quit', 'exit', 'q']:
                     break
                 elif user_input.lower() == 'clear':
-                    if self.has_display:
-                        self.lcd.clear()
-                    else:
-                        print("LCD: [CLEARED]")
+                    stop_scroller()
+                    self._submit_frame(None)
                     continue
                 elif user_input.lower().startswith('static '):
+                    stop_scroller()
                     static_msg = user_input[7:]  # Remove 'static ' prefix
                     if '|' in static_msg:
                         line1, line2 = static_msg.split('|', 1)
-                        self.display_text(line1.strip(), line2.strip())
+                        self._submit_frame(line1.strip(), line2.strip())
                     else:
-                        self.display_text(static_msg, "")
+                        self._submit_frame(static_msg, "")
                     print("Static message displayed. Type another command...")
                 elif '|' in user_input:
                     # Two-line message
+                    stop_scroller()
                     line1, line2 = user_input.split('|', 1)
-                    self.scroll_two_lines(line1.strip(), line2.strip(), speed=0.3)
+                    scroller = asyncio.create_task(
+                        self._scroll_two_lines(line1.strip(), line2.strip(), 0.3))
                 else:
                     # Single line scroll
-                    self.scroll_message(user_input, speed=0.3, line=1)
-                    
-        except (KeyboardInterrupt, EOFError):
-            pass
+                    stop_scroller()
+                    scroller = asyncio.create_task(
+                        self._scroll_message(user_input, 0.3, 1))
         finally:
-            self.cleanup()
+            stop_scroller()
+    
+    @staticmethod
+    async def _read_input(prompt):
+        """Read a line from stdin without blocking the event loop
+        
+        Uses a daemon thread rather than the default executor so that a
+        pending input() never holds up interpreter shutdown.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        
+        def deliver(setter, value):
+            if not future.done():
+                setter(value)
+        
+        def reader():
+            try:
+                value = input(prompt)
+            except EOFError as e:
+                loop.call_soon_threadsafe(deliver, future.set_exception, e)
+            else:
+                loop.call_soon_threadsafe(deliver, future.set_result, value)
+        
+        threading.Thread(target=reader, daemon=True).start()
+        return await future
     
     def cleanup(self):
         """Clean up and clear display"""
         self.running = False
         if self.has_display:
-            self.lcd.clear()
+            self.clear()
         print("\nDisplay cleared. Goodbye!")
     
     def signal_handler(self, signum, frame):
@@ -4,17 +4,19 @@ Provides animation primitives and visual effects for tiny OLED displays
 """
 import time
 import math
+from collections import deque
+from functools import lru_cache
 from PIL import ImageDraw, ImageFont
 
 class AnimationState:
     """Track animation state and timing"""
     def __init__(self):
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.progress = 0.0  # 0.0 to 1.0
 
     def update(self, duration=1.0):
         """Update animation progress (0.0 to 1.0)"""
-        elapsed = time.time() - self.start_time
+        elapsed = time.monotonic() - self.start_time
         self.progress = min(elapsed / duration, 1.0)
         return self.progress
 
@@ -24,140 +26,166 @@ class AnimationState:
 
     def reset(self):
         """Reset animation"""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.progress = 0.0
 
 
-class TechDrawing:
-    """Tech/Cyberpunk themed drawing primitives"""
+@lru_cache(maxsize=8)
+def _corner_bracket_points(width, height, size):
+    """Pixels covered by the four corner brackets (cached per geometry)"""
+    right, bottom = width - 1, height - 1
+    points = []
+    for x in range(size + 1):
+        points += [(x, 0), (right - x, 0), (x, bottom), (right - x, bottom)]
+    for y in range(1, size + 1):
+        points += [(0, y), (right, y), (0, bottom - y), (right, bottom - y)]
+    return tuple(points)
 
-    @staticmethod
-    def draw_corner_brackets(draw, width, height, size=4):
-        """Draw corner brackets [  ] framing the display"""
-        # Top-left
-        draw.line([(0, 0), (size, 0)], fill="white", width=1)
-        draw.line([(0, 0), (0, size)], fill="white", width=1)
 
-        # Top-right
-        draw.line([(width-size-1, 0), (width-1, 0)], fill="white", width=1)
-        draw.line([(width-1, 0), (width-1, size)], fill="white", width=1)
+@lru_cache(maxsize=8)
+def _segment_columns(x, width):
+    """x positions of the progress bar segment dividers (cached per geometry)"""
+    return tuple(range(x, x + width, 8))
 
-        # Bottom-left
-        draw.line([(0, height-1), (size, height-1)], fill="white", width=1)
-        draw.line([(0, height-size-1), (0, height-1)], fill="white", width=1)
 
-        # Bottom-right
-        draw.line([(width-size-1, height-1), (width-1, height-1)], fill="white", width=1)
-        draw.line([(width-1, height-size-1), (width-1, height-1)], fill="white", width=1)
+@lru_cache(maxsize=8)
+def _audio_bar_columns(x, width, bar_count):
+    """(left, right) pixel extents of each audio bar (cached per geometry)"""
+    bar_width = width // bar_count
+    spacing = 1
+    return tuple((x + i * bar_width, x + (i + 1) * bar_width - spacing)
+                 for i in range(bar_count))
 
-    @staticmethod
-    def draw_progress_bar(draw, x, y, width, height, progress, style="geometric"):
-        """Draw progress bar with tech aesthetic
 
-        Args:
-            style: "geometric" (filled rectangles) or "scan" (scanning line)
-        """
-        # Background bar
-        draw.rectangle([(x, y), (x + width, y + height)], outline="white", fill="black")
-
-        if style == "geometric":
-            # Filled geometric pattern
-            fill_width = int(width * progress)
-            if fill_width > 0:
-                # Main fill
-                draw.rectangle([(x, y), (x + fill_width, y + height)], fill="white")
-
-                # Add segmented look (every 8 pixels)
-                for seg_x in range(x, x + fill_width, 8):
-                    draw.line([(seg_x, y), (seg_x, y + height)], fill="black", width=1)
-
-        elif style == "scan":
-            # Scanning line effect
-            scan_x = x + int(width * progress)
-            if scan_x < x + width:
-                draw.line([(scan_x, y), (scan_x, y + height)], fill="white", width=2)
+# Drawing primitives (module-level to keep per-frame calls cheap)
 
-    @staticmethod
-    def draw_audio_bars(draw, x, y, width, height, levels, bar_count=10):
-        """Draw vertical audio level bars
+def draw_corner_brackets(draw, width, height, size=4):
+    """Draw corner brackets [  ] framing the display"""
+    # All eight bracket strokes go to PIL as one point batch
+    draw.point(_corner_bracket_points(width, height, size), fill="white")
 
-        Args:
-            levels: List of float values 0.0-1.0 for each bar
-        """
-        bar_width = width // bar_count
-        spacing = 1
 
-        for i in range(bar_count):
-            bar_x = x + i * bar_width
+def draw_progress_bar(draw, x, y, width, height, fill_width, style="geometric"):
+    """Draw progress bar with tech aesthetic
 
-            # Get level for this bar (or 0 if not enough data)
-            level = levels[i] if i < len(levels) else 0.0
-            bar_height = int(height * level)
+    Args:
+        fill_width: Filled length in whole pixels (0 to width)
+        style: "geometric" (filled rectangles) or "scan" (scanning line)
+    """
+    # Background bar
+    draw.rectangle([(x, y), (x + width, y + height)], outline="white", fill="black")
+
+    if style == "geometric":
+        # Filled geometric pattern
+        if fill_width > 0:
+            # Main fill
+            fill_end = x + fill_width
+            draw.rectangle([(x, y), (fill_end, y + height)], fill="white")
+
+            # Add segmented look (every 8 pixels)
+            for seg_x in _segment_columns(x, width):
+                if seg_x >= fill_end:
+                    break
+                draw.line([(seg_x, y), (seg_x, y + height)], fill="black", width=1)
+
+    elif style == "scan":
+        # Scanning line effect
+        if fill_width < width:
+            scan_x = x + fill_width
+            draw.line([(scan_x, y), (scan_x, y + height)], fill="white", width=2)
 
-            if bar_height > 0:
-                # Draw bar from bottom up
-                bar_y = y + height - bar_height
-                draw.rectangle([
-                    (bar_x, bar_y),
-                    (bar_x + bar_width - spacing, y + height)
-                ], fill="white")
 
-    @staticmethod
-    def draw_scanning_line(draw, x, y, width, height, progress):
-        """Draw animated scanning line effect"""
-        scan_x = x + int(width * progress)
+def draw_audio_bars(draw, x, y, width, height, levels, bar_count=10):
+    """Draw vertical audio level bars
 
-        # Main scan line
-        draw.line([(scan_x, y), (scan_x, y + height)], fill="white", width=1)
+    Args:
+        levels: List of float values 0.0-1.0 for each bar
+    """
+    bottom = y + height
+    columns = _audio_bar_columns(x, width, bar_count)
 
-        # Fading trail (3 pixels behind)
-        for offset in range(1, 4):
-            trail_x = scan_x - offset
-            if trail_x >= x:
-                # Fade by using dotted pattern
-                if offset == 1:
-                    draw.line([(trail_x, y), (trail_x, y + height)], fill="white", width=1)
+    # Missing levels (not enough data yet) are simply not drawn
+    for (left, right), level in zip(columns, levels):
+        bar_height = int(height * level)
 
-    @staticmethod
-    def draw_status_dots(draw, x, y, count=3, active=0, spacing=4):
-        """Draw status indicator dots ●●●
+        if bar_height > 0:
+            # Draw bar from bottom up
+            draw.rectangle([(left, bottom - bar_height), (right, bottom)], fill="white")
 
-        Args:
-            active: Which dot is active (0-based, -1 for all inactive)
-        """
-        dot_radius = 2
-        for i in range(count):
-            dot_x = x + i * spacing
-            fill = "white" if i == active else "black"
-            outline = "white"
 
-            draw.ellipse([
-                (dot_x - dot_radius, y - dot_radius),
-                (dot_x + dot_radius, y + dot_radius)
-            ], fill=fill, outline=outline)
+def draw_scanning_line(draw, x, y, width, height, offset):
+    """Draw animated scanning line effect
 
-    @staticmethod
-    def draw_angular_divider(draw, x, y, width):
-        """Draw angular tech-style divider [========]"""
-        # Left bracket
-        draw.line([(x, y), (x + 2, y)], fill="white", width=1)
+    Args:
+        offset: Scan line position in whole pixels from x
+    """
+    scan_x = x + offset
 
-        # Main line
-        draw.line([(x + 3, y), (x + width - 3, y)], fill="white", width=1)
+    # Main scan line plus its 1px trail, clipped at the left edge
+    draw.rectangle([(max(x, scan_x - 1), y), (scan_x, y + height)], fill="white")
 
-        # Right bracket
-        draw.line([(x + width - 2, y), (x + width, y)], fill="white", width=1)
 
-    @staticmethod
-    def draw_text_with_shadow(draw, position, text, font, shadow_offset=1):
-        """Draw text with subtle shadow for depth"""
-        x, y = position
+def draw_status_dots(draw, x, y, count=3, active=0, spacing=4):
+    """Draw status indicator dots ●●●
+
+    Args:
+        active: Which dot is active (0-based, -1 for all inactive)
+    """
+    dot_radius = 2
+    for i in range(count):
+        dot_x = x + i * spacing
+        fill = "white" if i == active else "black"
+
+        draw.ellipse([
+            (dot_x - dot_radius, y - dot_radius),
+            (dot_x + dot_radius, y + dot_radius)
+        ], fill=fill, outline="white")
 
-        # Shadow (slightly offset)
-        draw.text((x + shadow_offset, y + shadow_offset), text, fill="black", font=font)
 
-        # Main text
-        draw.text((x, y), text, fill="white", font=font)
+def draw_angular_divider(draw, x, y, width):
+    """Draw angular tech-style divider [========]"""
+    # Left bracket
+    draw.line([(x, y), (x + 2, y)], fill="white", width=1)
+
+    # Main line
+    draw.line([(x + 3, y), (x + width - 3, y)], fill="white", width=1)
+
+    # Right bracket
+    draw.line([(x + width - 2, y), (x + width, y)], fill="white", width=1)
+
+
+def draw_text_with_shadow(draw, position, text, font, shadow_offset=1):
+    """Draw text with subtle shadow for depth"""
+    x, y = position
+
+    # Shadow (slightly offset)
+    draw.text((x + shadow_offset, y + shadow_offset), text, fill="black", font=font)
+
+    # Main text
+    draw.text((x, y), text, fill="white", font=font)
+
+
+class TechDrawing:
+    """Tech/Cyberpunk themed drawing primitives
+
+    Namespace kept for existing callers; per-frame code should call the
+    module-level functions directly.
+    """
+    draw_corner_brackets = staticmethod(draw_corner_brackets)
+    draw_audio_bars = staticmethod(draw_audio_bars)
+    draw_status_dots = staticmethod(draw_status_dots)
+    draw_angular_divider = staticmethod(draw_angular_divider)
+    draw_text_with_shadow = staticmethod(draw_text_with_shadow)
+
+    @staticmethod
+    def draw_progress_bar(draw, x, y, width, height, progress, style="geometric"):
+        """Draw progress bar; progress is 0.0-1.0 as in the original API"""
+        draw_progress_bar(draw, x, y, width, height, int(width * progress), style)
+
+    @staticmethod
+    def draw_scanning_line(draw, x, y, width, height, progress):
+        """Draw scanning line; progress is 0.0-1.0 as in the original API"""
+        draw_scanning_line(draw, x, y, width, height, int(width * progress))
 
 
 class LoadingAnimation:
@@ -170,6 +198,9 @@ class LoadingAnimation:
         self.stage = "INIT"
         self.stages = ["INIT", "LOADING MODEL", "READY"]
         self.stage_index = 0
+        self.fps = 30  # Frame rate ceiling for draw()
+        self._last_draw = 0.0
+        self._last_frame_key = None
 
     def update(self, progress, stage=None):
         """Update loading progress
@@ -192,32 +223,54 @@ class LoadingAnimation:
         return progress
 
     def draw(self, draw, progress):
-        """Draw loading animation frame"""
+        """Draw loading animation frame
+
+        Returns:
+            True if a frame was drawn, False if it was skipped because
+            nothing visible changed or the fps budget is not yet spent
+            (the final 100% frame is never rate limited)
+        """
+        # Quantize once; text comes from the float, geometry from whole pixels
+        bar_width = self.width - 16
+        percent = int(progress * 100)
+        fill_width = int(bar_width * progress)
+        scan_x = int(self.width * ((progress * 2) % 1.0))  # Scan faster than progress
+
+        # Stage text, percentage and pixel positions cover everything that moves
+        frame_key = (self.stage, percent, fill_width, scan_x)
+        if frame_key == self._last_frame_key:
+            return False
+        now = time.monotonic()
+        if progress < 1.0 and now - self._last_draw < 1.0 / self.fps:
+            return False
+        self._last_draw = now
+        self._last_frame_key = frame_key
+
         # Clear background
         draw.rectangle([(0, 0), (self.width, self.height)], fill="black")
 
         # Corner brackets
-        TechDrawing.draw_corner_brackets(draw, self.width, self.height)
+        draw_corner_brackets(draw, self.width, self.height)
 
         # Stage text at top
         stage_text = self.stage
         draw.text((8, 4), stage_text, fill="white")
 
         # Progress bar in middle
-        bar_width = self.width - 16
         bar_height = 6
         bar_x = 8
         bar_y = 14
-        TechDrawing.draw_progress_bar(draw, bar_x, bar_y, bar_width, bar_height,
-                                      progress, style="geometric")
+        draw_progress_bar(draw, bar_x, bar_y, bar_width, bar_height,
+                          fill_width, style="geometric")
 
         # Percentage
-        percentage = f"{int(progress * 100)}%"
+        percentage = f"{percent}%"
         draw.text((self.width - 28, 22), percentage, fill="white")
 
         # Scanning line effect
-        scan_progress = (progress * 2) % 1.0  # Scan faster than progress
-        TechDrawing.draw_scanning_line(draw, 0, 0, self.width, self.height, scan_progress)
+        draw_scanning_line(draw, 0, 0, self.width, self.height, scan_x)
+
+        return True
 
 
 class AudioVisualizer:
@@ -227,9 +280,11 @@ class AudioVisualizer:
         self.width = width
         self.height = height
         self.bar_count = bar_count
-        self.levels = [0.0] * bar_count
+        self.levels = deque([0.0] * bar_count, maxlen=bar_count)
         self.peaks = [0.0] * bar_count
         self.peak_decay = 0.05  # How fast peaks fall
+        self.fps = 30  # Frame rate ceiling for draw()
+        self._last_draw = 0.0
 
     def update(self, audio_level):
         """Update audio levels
@@ -237,20 +292,33 @@ class AudioVisualizer:
         Args:
             audio_level: Single float 0.0-1.0 representing current audio RMS
         """
-        # Shift levels left
-        self.levels = self.levels[1:] + [audio_level]
-
-        # Update peaks (hold then decay)
-        for i in range(len(self.peaks)):
-            if self.levels[i] > self.peaks[i]:
-                self.peaks[i] = self.levels[i]
+        # Shift levels left (the bounded deque drops the oldest in place)
+        self.levels.append(audio_level)
+
+        # Update peaks in place (hold then decay)
+        peaks = self.peaks
+        decay = self.peak_decay
+        for i, level in enumerate(self.levels):
+            if level > peaks[i]:
+                peaks[i] = level
             else:
-                self.peaks[i] = max(0.0, self.peaks[i] - self.peak_decay)
+                peaks[i] = max(0.0, peaks[i] - decay)
+
+    def draw(self, draw, x, y, width, height, force=False):
+        """Draw audio visualization bars
+
+        Returns:
+            True if the bars were drawn, False if skipped because the fps
+            budget is not yet spent (pass force=True to always draw)
+        """
+        now = time.monotonic()
+        if not force and now - self._last_draw < 1.0 / self.fps:
+            return False
+        self._last_draw = now
 
-    def draw(self, draw, x, y, width, height):
-        """Draw audio visualization bars"""
-        TechDrawing.draw_audio_bars(draw, x, y, width, height,
+        draw_audio_bars(draw, x, y, width, height,
                                     self.levels, self.bar_count)
+        return True
 
 
 class TransitionEffect:
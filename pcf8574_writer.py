@@ -0,0 +1,178 @@
+"""
+PCF8574 Batch Writer - Fast text path for HD44780 LCDs on a PCF8574 backpack
+Sends a whole frame update (every changed row) as one I2C transaction instead of RPLCD's
+several single-byte transactions per character, and tracks what each row shows
+so only changed cells are sent
+"""
+try:
+    from smbus2 import SMBus, i2c_msg
+    HAS_SMBUS = True
+except ImportError:
+    HAS_SMBUS = False
+
+# PCF8574 -> HD44780 pin mapping (same wiring RPLCD's PCF8574 mode assumes)
+PIN_RS = 0x01
+PIN_E = 0x04
+PIN_BACKLIGHT = 0x08
+
+LCD_SETDDRAMADDR = 0x80
+
+# Characters that map 1:1 onto the HD44780 A00 ROM: custom CGRAM slots 0-7
+# and printable ASCII except '\' (yen) and '~' / DEL (arrows/blocks)
+_DIRECT_CODES = frozenset(range(8)) | (frozenset(range(0x20, 0x7E)) - {0x5C})
+
+
+class PCF8574Writer:
+    """Write LCD text as a single I2C message per update
+
+    Every nibble is clocked as three expander states (data, data+E, data),
+    and each character is followed by one idle byte. At 100-400 kHz this
+    keeps the enable pulse and the 37us HD44780 write time well inside the
+    byte period, so no software delays are needed between bytes.
+    """
+
+    def __init__(self, lcd, i2c_addr, cols=16, rows=2, port=1):
+        self.lcd = lcd  # RPLCD instance whose state we keep in sync
+        self.i2c_addr = i2c_addr
+        self.cols = cols
+        self.rows = rows
+        self.row_offsets = (0x00, 0x40, cols, 0x40 + cols)
+        self.bus = SMBus(port)
+
+    def _pack(self, payload, value, rs, light):
+        """Append the expander byte sequence for one 8-bit LCD transfer"""
+        for nibble in (value & 0xF0, (value << 4) & 0xF0):
+            bits = nibble | rs | light
+            payload += bytes((bits, bits | PIN_E, bits))
+
+    def encode(self, row, col, text):
+        """Build the I2C payload that positions the cursor and writes text
+
+        Returns None if text contains characters that need RPLCD's charmap.
+        """
+        codes = [ord(char) for char in text]
+        if not _DIRECT_CODES.issuperset(codes):
+            return None
+
+        light = PIN_BACKLIGHT if getattr(self.lcd, 'backlight_enabled', True) else 0
+        payload = bytearray()
+        self._pack(payload, LCD_SETDDRAMADDR | (self.row_offsets[row] + col), 0, light)
+        for code in codes:
+            self._pack(payload, code, PIN_RS, light)
+            payload.append(light)  # Idle byte: settle time before next char
+        return payload
+
+    def write(self, row, col, text):
+        """Write text at (row, col); returns False if the caller must fall back"""
+        return self.write_spans(((row, col, text),))
+
+    def write_spans(self, spans):
+        """Write several (row, col, text) spans as one I2C message
+
+        Returns False, having sent nothing, if the caller must fall back.
+        """
+        payload = bytearray()
+        for row, col, text in spans:
+            part = self.encode(row, col, text)
+            if part is None:
+                return False
+            payload += part
+
+        try:
+            self.bus.i2c_rdwr(i2c_msg.write(self.i2c_addr, payload))
+        except OSError:
+            return False
+
+        # RPLCD skips characters it believes are already shown, so mirror the
+        # write into its content cache to keep any later fallback honest
+        content = getattr(self.lcd, '_content', None)
+        if content is not None:
+            for row, col, text in spans:
+                content[row][col:col + len(text)] = [ord(char) for char in text]
+        return True
+
+    def close(self):
+        """Release the I2C bus handle"""
+        self.bus.close()
+
+
+def open_writer(lcd, i2c_addr, cols=16, rows=2, port=1):
+    """Create a PCF8574Writer, or return None if smbus2/the bus is unavailable"""
+    if not HAS_SMBUS:
+        return None
+    try:
+        return PCF8574Writer(lcd, i2c_addr, cols, rows, port)
+    except OSError as e:
+        print(f"Fast LCD path unavailable, using RPLCD: {e}")
+        return None
+
+
+class ShadowRows:
+    """Shadow copy of the text on each LCD row; writes only what changed
+
+    Each changed row sends the span from its first to its last differing
+    column. A frame's spans go out as one I2C message through the batched
+    writer when there is one, otherwise through RPLCD.
+    """
+
+    def __init__(self, lcd, cols=16, rows=2, writer=None):
+        self.lcd = lcd
+        self.cols = cols
+        self.rows = rows
+        self.writer = writer  # PCF8574Writer, or None to always use RPLCD
+        self._line_fmt = "{:<%d.%d}" % (cols, cols)
+        self.mark_cleared()
+
+    def fit(self, text):
+        """Pad or truncate text to the display width"""
+        return self._line_fmt.format(text)
+
+    def mark_cleared(self):
+        """Record that the LCD was cleared (every cell is a space)"""
+        self.shown = [" " * self.cols] * self.rows
+
+    def changed_span(self, row, text):
+        """Return (row, col, text) for the part of a row that differs from
+        what is shown, recording text as shown; None if unchanged
+        """
+        shown = self.shown[row]
+        if text == shown:
+            return None
+
+        changed = [i for i, (new, old) in enumerate(zip(text, shown)) if new != old]
+        start, end = changed[0], changed[-1] + 1
+        self.shown[row] = text
+        return (row, start, text[start:end])
+
+    def write_line(self, row, text):
+        """Show text (already fitted to the width) on one row"""
+        span = self.changed_span(row, text)
+        if span:
+            self.write_spans((span,))
+
+    def write_lines(self, *lines):
+        """Show one line per row, fitting each to the width; extra lines are ignored"""
+        spans = [span for span in (self.changed_span(row, self.fit(text))
+                                   for row, text in enumerate(lines[:self.rows]))
+                 if span]
+        if spans:
+            self.write_spans(spans)
+
+    def write_spans(self, spans):
+        """Write (row, col, text) spans, in one I2C message when the writer is up"""
+        if self.writer and self.writer.write_spans(spans):
+            return
+        for row, col, text in spans:
+            self.lcd.cursor_pos = (row, col)
+            self.lcd.write_string(text)
+
+    def close(self):
+        """Release the batched writer's I2C bus handle"""
+        if self.writer:
+            self.writer.close()
+            self.writer = None
+
+
+def open_shadow_rows(lcd, i2c_addr, cols=16, rows=2, port=1):
+    """Create ShadowRows for an RPLCD PCF8574 display, with the batched writer if available"""
+    return ShadowRows(lcd, cols, rows, open_writer(lcd, i2c_addr, cols, rows, port))
@@ -2,35 +2,56 @@
 """
 Voice LCD v2 - Configurable voice-activated display system
 Config: voice_config.json
-Auto-uses virtual environment (no need to activate manually)
+Auto-uses virtual environment via the shebang interpreter (no need to activate manually)
 """
-import sys
 import os
+import atexit
 import json
 import time
 import random
-import subprocess
-import socket
 import re
 import logging
 import logging.handlers
-import shutil
-import struct
-import array
+import threading
+import queue
+import warnings
+from collections import deque
 from datetime import datetime
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from itertools import chain, cycle, repeat
+
+# Vosk, PyAudio and RPLCD pull in native libraries, so only check they are
+# installed here; each is imported where it is first used (as is
+# subprocess, which only commands and the OLED service helpers need)
+HAS_VOSK = find_spec("vosk") is not None and find_spec("pyaudio") is not None
+HAS_LCD = find_spec("RPLCD") is not None
+
+try:
+    # Faster C parser for Vosk results; stdlib json is the fallback
+    from orjson import loads as json_loads
+    HAS_ORJSON = True
+except ImportError:
+    json_loads = json.loads
+    HAS_ORJSON = False
 
 try:
-    import vosk
-    import pyaudio
-    HAS_VOSK = True
+    # Single-pass multi-alias matching; falls back to a per-alias scan
+    import ahocorasick
+    HAS_AHOCORASICK = True
 except ImportError:
-    HAS_VOSK = False
+    HAS_AHOCORASICK = False
 
 try:
-    from RPLCD.i2c import CharLCD
-    HAS_LCD = True
+    # C sum-of-squares for audio levels; deprecated in 3.11, removed in 3.13
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        import audioop
+    HAS_AUDIOOP = True
+    _AUDIO_ERROR = audioop.error  # Raised for a partial trailing sample
 except ImportError:
-    HAS_LCD = False
+    HAS_AUDIOOP = False
+    _AUDIO_ERROR = ValueError
 
 try:
     from luma.core.interface.serial import i2c
@@ -42,13 +63,141 @@ try:
 except ImportError:
     HAS_OLED = False
 
+from frame_regulator import FrameRegulator
+from ip_lookup import get_ip_address
+from pcf8574_writer import ShadowRows, open_shadow_rows
+
 try:
-    from oled_animations import (LoadingAnimation, AudioVisualizer,
-                                  TransitionEffect, TechDrawing, ease_in_out_sine)
+    from oled_animations import (LoadingAnimation, AudioVisualizer, TransitionEffect,
+                                  draw_corner_brackets, draw_angular_divider,
+                                  draw_status_dots, ease_in_out_sine)
     HAS_ANIMATIONS = True
 except ImportError:
     HAS_ANIMATIONS = False
 
+# Loaded Vosk models by path, shared by every VoiceLCDv2 in the process
+_MODEL_CACHE = {}
+
+def load_vosk_model(model_path):
+    """Load a Vosk model once per path and reuse it afterwards"""
+    model = _MODEL_CACHE.get(model_path)
+    if model is None:
+        import vosk
+        model = _MODEL_CACHE[model_path] = vosk.Model(model_path)
+    return model
+
+_randint = random.randint
+
+def _sub_random(match):
+    """Expand a {random_LOW_HIGH} variable match"""
+    return str(_randint(int(match.group(1)), int(match.group(2))))
+
+def extract_text(result, field="text"):
+    """Pull a text field ("text" or "partial") out of a Vosk result string
+
+    Vosk's output layout is fixed, so a partition finds the field without
+    a full JSON parse; anything with escapes goes through the real parser.
+    """
+    _, found, rest = result.partition(f'"{field}" : "')
+    if found:
+        text, quote, _ = rest.partition('"')
+        if quote and '\\' not in text:
+            return text
+    return json_loads(result).get(field, '')
+
+@lru_cache(maxsize=64)
+def scroll_frames(text, cols):
+    """Every cols-wide window of text sliding in from the right and out the left
+
+    Jokes and command replies repeat, so the frames are built once per
+    (text, cols) and the same tuple is replayed on later scrolls.
+    """
+    padded = " " * cols + text + " " * cols
+    return tuple(padded[i:i+cols] for i in range(len(padded) - cols + 1))
+
+@lru_cache(maxsize=128)
+def wrap_lines(text, chars_per_line):
+    """Word-wrap text into lines of at most chars_per_line characters
+
+    Results are cached per (text, chars_per_line): the same transcript or
+    command reply is often redrawn, and the tuple can be shared safely.
+    """
+    if not text:
+        return ()
+
+    # First fit over word lengths: words are only joined once per line
+    lines = []
+    line_words = []
+    line_len = -1  # -1 while the line is empty, so the first word needs no space
+    for word in text.split():
+        if line_len + 1 + len(word) <= chars_per_line:
+            line_words.append(word)
+            line_len += 1 + len(word)
+            continue
+
+        # Start new line
+        if line_words:
+            lines.append(" ".join(line_words))
+
+        # Handle very long words
+        while len(word) > chars_per_line:
+            lines.append(word[:chars_per_line])
+            word = word[chars_per_line:]
+        line_words = [word]
+        line_len = len(word)
+
+    if line_words:
+        lines.append(" ".join(line_words))
+
+    return tuple(lines)
+
+def run_shell_head(cmd, timeout=None, limit=4096):
+    """Run a shell command, keeping only the first limit bytes of its output
+
+    The rest of each stream is read and discarded, so the command never
+    stalls on a full pipe but a chatty one (dmesg, journalctl) is never
+    buffered whole just to show 50 characters. Returns (returncode,
+    stdout, stderr); on timeout the command is killed and
+    subprocess.TimeoutExpired raised, as subprocess.run does.
+    """
+    import signal
+    import subprocess
+    # Own process group, so a timeout also kills background children that
+    # hold the pipes open after the shell itself exits
+    proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            start_new_session=True)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    heads = {}
+
+    def drain(name, pipe):
+        with pipe:
+            heads[name] = pipe.read(limit)
+            while pipe.read(65536):
+                pass
+
+    # One reader per stream, so neither pipe can fill while the other is read
+    readers = [threading.Thread(target=drain, args=(name, pipe), daemon=True)
+               for name, pipe in (("stdout", proc.stdout), ("stderr", proc.stderr))]
+    for reader in readers:
+        reader.start()
+    try:
+        returncode = proc.wait(timeout=timeout)
+        for reader in readers:
+            reader.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+            if reader.is_alive():
+                raise subprocess.TimeoutExpired(cmd, timeout)
+    except subprocess.TimeoutExpired:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass  # Whole group already gone
+        proc.wait()
+        raise
+
+    return (returncode,
+            heads.get("stdout", b"").decode(errors="replace"),
+            heads.get("stderr", b"").decode(errors="replace"))
+
 class OLEDVoiceDisplay:
     """OLED display optimized for voice transcription on tiny 128x32 screen"""
 
@@ -57,8 +206,8 @@ class OLEDVoiceDisplay:
         self.width = 128
         self.height = 32
         self.current_text = ""
-        self.scroll_position = 0
-        self.scroll_timer = 0
+        self.scroll_line = 0   # First wrapped line shown while scrolling
+        self.scroll_timer = 0  # Frames since the last line advance
         self.status_message = "Voice: Ready"
 
         # Animation system
@@ -68,6 +217,13 @@ class OLEDVoiceDisplay:
         self.transition = None
         self.last_audio_level = 0.0
 
+        # Pooled frame reused by every animated screen (see _begin_frame)
+        self._frame = None
+        self._frame_draw = None
+        
+        # Key of the text screen currently shown (see _claim_screen)
+        self._shown_key = None
+
         if self.has_animations:
             self.loading_anim = LoadingAnimation(self.width, self.height)
             self.audio_viz = AudioVisualizer(self.width, self.height, bar_count=10)
@@ -97,11 +253,37 @@ class OLEDVoiceDisplay:
         """Clear the OLED display"""
         if self.device:
             self.device.clear()
+        self._shown_key = None
     
+    def _claim_screen(self, key):
+        """Return True if the screen described by key needs drawing
+
+        Text screens are a pure function of their key, so redrawing the
+        one already shown would only resend an identical frame over I2C.
+        """
+        if key == self._shown_key:
+            return False
+        self._shown_key = key
+        return True
+    
+    def _begin_frame(self):
+        """Clear the pooled frame image and return its draw handle
+
+        One image and ImageDraw are reused for every animated frame instead
+        of allocating a fresh pair per frame.
+        """
+        self._shown_key = None  # Animated screens replace any text screen
+        if self._frame is None:
+            self._frame = Image.new('1', (self.width, self.height), 0)
+            self._frame_draw = ImageDraw.Draw(self._frame)
+        else:
+            self._frame_draw.rectangle([(0, 0), (self.width, self.height)], fill="black")
+        return self._frame_draw
+
     def show_status(self, status):
         """Show status message"""
         self.status_message = status
-        if self.device:
+        if self.device and self._claim_screen(("status", status)):
             with canvas(self.device) as draw:
                 # Status line at top
                 draw.text((0, 0), self.status_message[:21], fill="white")
@@ -113,50 +295,56 @@ class OLEDVoiceDisplay:
         if not self.device:
             return
             
-        self.current_text = text
+        if text != self.current_text:
+            # New text starts scrolling from its first line
+            self.current_text = text
+            self.scroll_line = 0
+            self.scroll_timer = 0
         wrapped_lines = self.wrap_text(text, 21)  # ~21 chars per line on 128px width
         
-        with canvas(self.device) as draw:
-            # Status line
-            draw.text((0, 0), self.status_message[:21], fill="white")
-            draw.line((0, 10, self.width-1, 10), fill="white")
-            
-            # Text area (lines 2-4, starting at y=12)
-            y_start = 12
-            line_height = 8
-            max_visible_lines = 2  # Can fit ~2.5 lines, use 2 for readability
-            
-            if len(wrapped_lines) <= max_visible_lines:
-                # Text fits without scrolling
-                for i, line in enumerate(wrapped_lines):
-                    if i < max_visible_lines:
-                        draw.text((2, y_start + i * line_height), line, fill="white")
-            else:
-                # Need scrolling - show scrolling indicator
-                draw.text((self.width-10, y_start), ">>", fill="white")
+        # Text area (lines 2-4, starting at y=12)
+        y_start = 12
+        line_height = 8
+        max_visible_lines = 2  # Can fit ~2.5 lines, use 2 for readability
+        scrolling = len(wrapped_lines) > max_visible_lines
+        
+        # Show subset of lines based on scroll position
+        start_line = self.scroll_line if scrolling else 0
+        visible = wrapped_lines[start_line:start_line + max_visible_lines]
+        
+        # Between line advances the frame is unchanged - skip the repaint
+        if self._claim_screen(("text", self.status_message, visible, scrolling)):
+            with canvas(self.device) as draw:
+                # Status line
+                draw.text((0, 0), self.status_message[:21], fill="white")
+                draw.line((0, 10, self.width-1, 10), fill="white")
                 
-                # Show subset of lines based on scroll position
-                start_line = self.scroll_position // 20  # Scroll every 20 frames (1 second at 20fps)
-                for i in range(max_visible_lines):
-                    line_idx = start_line + i
-                    if line_idx < len(wrapped_lines):
-                        draw.text((2, y_start + i * line_height), wrapped_lines[line_idx], fill="white")
+                if scrolling:
+                    # Need scrolling - show scrolling indicator
+                    draw.text((self.width-10, y_start), ">>", fill="white")
                 
-                # Auto-scroll through lines
-                self.scroll_timer += 1
-                if self.scroll_timer >= 40:  # 2 seconds per line
-                    self.scroll_position += 20
-                    if self.scroll_position >= len(wrapped_lines) * 20:
-                        self.scroll_position = 0
-                    self.scroll_timer = 0
+                for i, line in enumerate(visible):
+                    draw.text((2, y_start + i * line_height), line, fill="white")
+        
+        if scrolling:
+            # Auto-scroll through lines
+            self.scroll_timer += 1
+            if self.scroll_timer >= 40:  # 2 seconds per line at 20fps
+                self.scroll_line += 1
+                if self.scroll_line >= len(wrapped_lines):
+                    self.scroll_line = 0
+                self.scroll_timer = 0
     
     def show_command_result(self, result_text):
         """Show command execution result"""
-        self.show_status("Voice: Result")
+        # Set the status without drawing it: the result screen repaints it
+        self.status_message = "Voice: Result"
         if not self.device:
             return
             
         wrapped_lines = self.wrap_text(result_text, 21)
+        if not self._claim_screen(("result", wrapped_lines[:2])):
+            return
         
         with canvas(self.device) as draw:
             # Status
@@ -172,34 +360,7 @@ class OLEDVoiceDisplay:
     
     def wrap_text(self, text, chars_per_line):
         """Wrap text to fit display width with word boundaries"""
-        if not text:
-            return []
-            
-        words = text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            # Check if adding word would exceed line length
-            test_line = current_line + (" " if current_line else "") + word
-            
-            if len(test_line) <= chars_per_line:
-                current_line = test_line
-            else:
-                # Start new line
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-                
-                # Handle very long words
-                while len(current_line) > chars_per_line:
-                    lines.append(current_line[:chars_per_line])
-                    current_line = current_line[chars_per_line:]
-        
-        if current_line:
-            lines.append(current_line)
-        
-        return lines
+        return wrap_lines(text, chars_per_line)
     
     def show_loading(self, progress, stage=None):
         """Show animated loading screen
@@ -218,16 +379,13 @@ class OLEDVoiceDisplay:
             self.show_status(f"{stage_text}: {pct}%")
             return
 
-        # Create image for drawing
-        image = Image.new('1', (self.width, self.height), 0)
-        draw = ImageDraw.Draw(image)
+        # Draw into the pooled frame
+        draw = self._begin_frame()
 
-        # Update and draw loading animation
+        # Update and draw loading animation (skipped frames aren't pushed)
         self.loading_anim.update(progress, stage)
-        self.loading_anim.draw(draw, progress)
-
-        # Display frame
-        self.device.display(image)
+        if self.loading_anim.draw(draw, progress):
+            self.device.display(self._frame)
 
     def show_audio_visualization(self, audio_level, status="LISTENING"):
         """Show audio level visualization with status
@@ -247,27 +405,27 @@ class OLEDVoiceDisplay:
         # Update audio visualizer
         self.audio_viz.update(audio_level)
 
-        # Create image for drawing
-        image = Image.new('1', (self.width, self.height), 0)
-        draw = ImageDraw.Draw(image)
+        # Draw into the pooled frame
+        draw = self._begin_frame()
+
+        # Audio bars at bottom (12px height); skip the frame if over fps budget
+        bar_y = self.height - 14
+        bar_height = 12
+        if not self.audio_viz.draw(draw, 4, bar_y, self.width - 8, bar_height):
+            return
 
         # Tech aesthetic background
-        TechDrawing.draw_corner_brackets(draw, self.width, self.height, size=4)
+        draw_corner_brackets(draw, self.width, self.height, size=4)
 
         # Status text at top
         status_text = f">> {status}"
         draw.text((8, 2), status_text, fill="white")
 
         # Angular divider
-        TechDrawing.draw_angular_divider(draw, 4, 12, self.width - 8)
-
-        # Audio bars at bottom (12px height)
-        bar_y = self.height - 14
-        bar_height = 12
-        self.audio_viz.draw(draw, 4, bar_y, self.width - 8, bar_height)
+        draw_angular_divider(draw, 4, 12, self.width - 8)
 
         # Display frame
-        self.device.display(image)
+        self.device.display(self._frame)
 
     def show_status_enhanced(self, status, show_audio=False, audio_level=0.0):
         """Show status with enhanced tech aesthetic
@@ -287,33 +445,32 @@ class OLEDVoiceDisplay:
             self.show_status(status)
             return
 
-        # Create image for drawing
-        image = Image.new('1', (self.width, self.height), 0)
-        draw = ImageDraw.Draw(image)
+        # Draw into the pooled frame
+        draw = self._begin_frame()
 
         # Tech aesthetic background
-        TechDrawing.draw_corner_brackets(draw, self.width, self.height, size=4)
+        draw_corner_brackets(draw, self.width, self.height, size=4)
 
         # Status with larger font
         status_text = f">> {status}"
         draw.text((8, 4), status_text, fill="white")
 
         # Angular divider
-        TechDrawing.draw_angular_divider(draw, 4, 16, self.width - 8)
+        draw_angular_divider(draw, 4, 16, self.width - 8)
 
         # Audio visualization if enabled
         if show_audio:
             self.audio_viz.update(audio_level)
             bar_y = 20
             bar_height = 10
-            self.audio_viz.draw(draw, 8, bar_y, self.width - 16, bar_height)
+            self.audio_viz.draw(draw, 8, bar_y, self.width - 16, bar_height, force=True)
         else:
             # Status dots animation
             dot_cycle = int(time.time() * 2) % 3  # Cycle through 3 dots
-            TechDrawing.draw_status_dots(draw, self.width // 2 - 6, 24, count=3, active=dot_cycle, spacing=6)
+            draw_status_dots(draw, self.width // 2 - 6, 24, count=3, active=dot_cycle, spacing=6)
 
         # Display frame
-        self.device.display(image)
+        self.device.display(self._frame)
 
     def show_command_result_enhanced(self, result_text):
         """Show command result with enhanced visual"""
@@ -325,18 +482,17 @@ class OLEDVoiceDisplay:
             self.show_command_result(result_text)
             return
 
-        # Create image for drawing
-        image = Image.new('1', (self.width, self.height), 0)
-        draw = ImageDraw.Draw(image)
+        # Draw into the pooled frame
+        draw = self._begin_frame()
 
         # Tech aesthetic background
-        TechDrawing.draw_corner_brackets(draw, self.width, self.height, size=4)
+        draw_corner_brackets(draw, self.width, self.height, size=4)
 
         # Header
         draw.text((8, 2), "RESULT", fill="white")
 
         # Divider
-        TechDrawing.draw_angular_divider(draw, 4, 12, self.width - 8)
+        draw_angular_divider(draw, 4, 12, self.width - 8)
 
         # Result text (wrapped)
         wrapped_lines = self.wrap_text(result_text, 19)
@@ -346,7 +502,7 @@ class OLEDVoiceDisplay:
             y += 8
 
         # Display frame
-        self.device.display(image)
+        self.device.display(self._frame)
 
     def show_follow_up_mode(self):
         """Show follow-up mode status with tech aesthetic"""
@@ -358,12 +514,11 @@ class OLEDVoiceDisplay:
             self.show_status("Voice: Ready...")
             return
 
-        # Create image for drawing
-        image = Image.new('1', (self.width, self.height), 0)
-        draw = ImageDraw.Draw(image)
+        # Draw into the pooled frame
+        draw = self._begin_frame()
 
         # Tech aesthetic background
-        TechDrawing.draw_corner_brackets(draw, self.width, self.height, size=4)
+        draw_corner_brackets(draw, self.width, self.height, size=4)
 
         # Status text
         draw.text((8, 4), "READY", fill="white")
@@ -374,13 +529,13 @@ class OLEDVoiceDisplay:
         draw.text((50, 4), dots + " " * (3 - dot_count), fill="white")
 
         # Divider
-        TechDrawing.draw_angular_divider(draw, 4, 16, self.width - 8)
+        draw_angular_divider(draw, 4, 16, self.width - 8)
 
         # Hint text
         draw.text((6, 20), "Say command", fill="white")
 
         # Display frame
-        self.device.display(image)
+        self.device.display(self._frame)
 
     def update_audio_level(self, audio_level):
         """Update stored audio level for visualization
@@ -401,6 +556,8 @@ class VoiceLCDv2:
         self.config_path = config_path
         self.logger = None  # Initialize logger first
         self.loggers = {}   # Component loggers
+        self._log_file_handler = None  # Rotating handler behind the log queue
+        self.console_output = True  # Echo logs to stdout until config says otherwise
         self.load_config()
         
         # Setup enhanced logging system
@@ -409,18 +566,46 @@ class VoiceLCDv2:
         # Validate configuration
         self.validate_config()
 
+        # Start the slow model load now so it overlaps display setup
+        self.preload_speech_model()
+
         # Display setup (LCD with OLED fallback)
         self.setup_display()
         
         # Speech setup
         self.setup_speech()
         
-        # Command history
-        self.command_history = []
+        # Action name -> handler, resolved once instead of an elif chain
+        self._actions = {
+            "show_ip": self._act_show_ip,
+            "show_time": self._act_show_time,
+            "tell_joke": self._act_tell_joke,
+            "custom_message": self._act_custom_message,
+            "run_command": self._act_run_command,
+            "show_log_info": self._act_show_log_info,
+            "clean_logs": self._act_clean_logs,
+            "system_health": self._act_system_health,
+            "clear_display": self._act_clear_display,
+        }
+        
+        # Command history (bounded; oldest entries fall off automatically)
+        max_history = self.config.get("advanced", {}).get("max_command_history", 50)
+        self.command_history = deque(maxlen=max_history)
+        
+        # IP lookup cache: (address, monotonic timestamp)
+        self._ip_cache = (None, 0.0)
+        self.ip_cache_ttl = 30.0
+        
+        # System health cache: (health dict, monotonic timestamp)
+        self._health_cache = (None, 0.0)
+        self.health_cache_ttl = 5.0
         
         # Ring buffer initialization
         self.init_ring_buffer()
 
+        # Voice activity gate initialization
+        self.init_vad_gate()
+
         # Follow-up mode initialization
         self.init_follow_up_mode()
 
@@ -474,6 +659,12 @@ class VoiceLCDv2:
                 if key not in hw:
                     warnings.append(f"Missing hardware config: '{key}'")
 
+            # Vosk models run natively at 16 kHz (some at 8 kHz); any other
+            # capture rate is resampled inside the recognizer on every chunk
+            rate = hw.get("audio_sample_rate")
+            if rate is not None and rate not in (8000, 16000):
+                warnings.append(f"audio_sample_rate {rate} is resampled by Vosk - 16000 saves CPU if the mic supports it")
+
         # Check commands
         if "commands" in self.config:
             if not self.config["commands"]:
@@ -525,6 +716,14 @@ class VoiceLCDv2:
         )
         handler.setFormatter(logging.Formatter(log_format))
         
+        # Loggers only enqueue records; a listener thread does the file
+        # writes so SD-card I/O never stalls the listen loop
+        self._log_file_handler = handler
+        self._log_listener = logging.handlers.QueueListener(queue.SimpleQueue(), handler)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)  # Flush queued records on exit
+        handler = logging.handlers.QueueHandler(self._log_listener.queue)
+        
         # Setup main logger
         self.logger = logging.getLogger("voice_lcd_main")
         self.logger.setLevel(getattr(logging, main_config.get("level", "INFO")))
@@ -542,7 +741,8 @@ class VoiceLCDv2:
     
     def log(self, message, component="system"):
         """Enhanced logging with component support"""
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        if self.console_output:
+            print(f"[{time.strftime('%H:%M:%S')}] {message}")
         if self.logger:
             if component in self.loggers:
                 self.loggers[component].info(message)
@@ -564,12 +764,66 @@ class VoiceLCDv2:
     def load_config(self):
         """Load configuration from JSON file"""
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
+            with open(self.config_path, 'rb') as f:
+                self.config = json_loads(f.read())
             self.log(f"Config loaded from {self.config_path}")
         except Exception as e:
             self.log(f"Error loading config: {e}")
             self.config = self.default_config()
+        self._refresh_cached_config()
+        self._build_alias_index()
+    
+    def _refresh_cached_config(self):
+        """Bind hot, fixed-at-runtime config values to attributes"""
+        hw = self.config.get("hardware", {})
+        display = self.config.get("display", {})
+        self.cols = hw.get("lcd_cols", 16)
+        self.rows = hw.get("lcd_rows", 2)
+        self.scroll_speed = display.get("scroll_speed", 0.15)
+        self.heard_text_cycles = display.get("heard_text_cycles", 2)
+        self.short_text_time = display.get("short_text_display_time", 3.0)
+        self.cmd_result_time = display.get("command_result_time", 3.0)
+        self.sample_rate = hw.get("audio_sample_rate", 16000)
+        # Default to 100 ms chunks: short enough for prompt endpointing,
+        # long enough to keep per-read overhead low
+        self.chunk_size = hw.get("audio_chunk_size") or self.sample_rate // 10
+        
+        # Checked once per transcription in listen()
+        transcription_log = self.config.get("logging", {}).get("component_logs", {}).get("transcription", {})
+        self.log_transcriptions = transcription_log.get("enabled", True)
+        
+        # Single-word wake words match whole words via one set check;
+        # multi-word phrases keep the substring test
+        self.wake_words = self.config.get("voice", {}).get("wake_words", [])
+        wake_words = [w.strip().lower() for w in self.wake_words if w.strip()]
+        self._wake_set = frozenset(w for w in wake_words if ' ' not in w)
+        self._wake_phrases = tuple(w for w in wake_words if ' ' in w)
+        self.early_wake_feedback = self.config.get("voice", {}).get("early_wake_feedback", False)
+        self.console_output = self.config.get("advanced", {}).get("console_output", True)
+        self.history_enabled = self.config.get("advanced", {}).get("enable_command_history", False)
+    
+    def _build_alias_index(self):
+        """Flatten command names and aliases into one lowercased lookup
+        
+        Insertion order mirrors the config, so the first command listed
+        still wins when several names match the same utterance.
+        """
+        self._alias_index = {}
+        for command_name, command_config in self.config.get("commands", {}).items():
+            entry = (command_name, command_config)
+            self._alias_index.setdefault(command_name.lower(), entry)
+            for alias in command_config.get("aliases", []):
+                self._alias_index.setdefault(alias.lower(), entry)
+        
+        # Automaton payloads carry the index position so matching can still
+        # honour config order rather than position in the utterance
+        self._alias_automaton = None
+        if HAS_AHOCORASICK and self._alias_index:
+            automaton = ahocorasick.Automaton()
+            for priority, (token, entry) in enumerate(self._alias_index.items()):
+                automaton.add_word(token, (priority, entry))
+            automaton.make_automaton()
+            self._alias_automaton = automaton
     
     def default_config(self):
         """Fallback config if file missing"""
@@ -585,6 +839,7 @@ class VoiceLCDv2:
         """Initialize display - LCD with OLED fallback"""
         self.display_mode = None
         self.lcd = None
+        self._screen = None
         self.oled_display = None
         self.oled_service_stopped = False
         
@@ -608,21 +863,35 @@ class VoiceLCDv2:
         if not HAS_LCD:
             self.log_hardware("LCD libraries not available")
             return False
+        try:
+            from RPLCD.i2c import CharLCD
+        except ImportError as e:
+            self.log_hardware(f"LCD libraries failed to load: {e}")
+            return False
 
         hw = self.config["hardware"]
         max_retries = 3
         backpack_type = hw.get("i2c_backpack_type", "PCF8574")
+        port = hw.get("i2c_port", 1)  # RPLCD and the batched writer must share a bus
 
         for attempt in range(max_retries):
             try:
                 addr = int(hw["lcd_i2c_address"], 16)
-                self.lcd = CharLCD(backpack_type, addr,
+                self.lcd = CharLCD(backpack_type, addr, port=port,
                                  cols=hw["lcd_cols"], rows=hw["lcd_rows"])
                 self.lcd.clear()
+                # Row shadow: sends only changed cells, batched over I2C on a PCF8574
+                if backpack_type == "PCF8574":
+                    self._screen = open_shadow_rows(self.lcd, addr, self.cols, self.rows, port)
+                else:
+                    self._screen = ShadowRows(self.lcd, self.cols, self.rows)
                 self.log_hardware(f"LCD connected at {hw['lcd_i2c_address']} using {backpack_type} (attempt {attempt + 1})")
                 return True
             except Exception as e:
                 self.log_hardware(f"LCD setup attempt {attempt + 1} failed: {e}")
+                if self._screen:
+                    self._screen.close()
+                    self._screen = None
                 if attempt < max_retries - 1:
                     time.sleep(0.5)
 
@@ -637,9 +906,10 @@ class VoiceLCDv2:
 
         try:
             # Stop oled.service if running
+            # No settle delay needed: systemctl stop only returns once the
+            # stop job has finished and the service has released the panel
             if self.stop_oled_service():
                 self.oled_service_stopped = True
-                time.sleep(2)  # Give service time to stop
 
             # Get hardware config
             hw = self.config.get("hardware", {})
@@ -669,6 +939,7 @@ class VoiceLCDv2:
     
     def stop_oled_service(self):
         """Stop oled.service to free up OLED for voice display"""
+        import subprocess
         try:
             hw = self.config.get("hardware", {})
             service_name = hw.get("oled_service_name", "oled.service")
@@ -690,6 +961,7 @@ class VoiceLCDv2:
 
     def start_oled_service(self):
         """Restart oled.service"""
+        import subprocess
         try:
             hw = self.config.get("hardware", {})
             service_name = hw.get("oled_service_name", "oled.service")
@@ -715,11 +987,46 @@ class VoiceLCDv2:
         if self.oled_display:
             self.oled_display.cleanup()
         
+        if self._screen:
+            self._screen.close()
+            self._screen = None
+        
         if self.oled_service_stopped:
             self.log_hardware("Restoring oled.service...")
             self.start_oled_service()
             self.oled_service_stopped = False
     
+    def preload_speech_model(self):
+        """Start loading the Vosk model on a background thread
+
+        Vosk releases the GIL while it reads the model, so display setup
+        (LCD probing, stopping oled.service) runs alongside the 30+ second
+        load instead of before it. setup_speech() waits for the result.
+        """
+        self._model_loader = None
+        if not HAS_VOSK:
+            return
+        
+        model_path = self.resolve_path(self.config.get("voice", {}).get("model_path", ""))
+        if not os.path.exists(model_path):
+            return  # setup_speech reports the missing model
+        
+        def preload():
+            try:
+                load_vosk_model(model_path)
+            except Exception:
+                pass  # setup_speech retries the load and reports the error
+        
+        self._model_loader = threading.Thread(target=preload, daemon=True)
+        self._model_loader.start()
+    
+    def wait_for_model(self, model_path):
+        """Return the Vosk model, waiting for the background load if running"""
+        if self._model_loader is not None:
+            self._model_loader.join()
+            self._model_loader = None
+        return load_vosk_model(model_path)  # Cached unless the preload failed
+    
     def setup_speech(self):
         """Initialize speech recognition"""
         if not HAS_VOSK:
@@ -736,12 +1043,13 @@ class VoiceLCDv2:
             return
 
         try:
+            # Fail here, not in listen(), if PortAudio is broken
+            import pyaudio
+            self._pyaudio = pyaudio
             self.log_hardware("Loading speech model... (30+ seconds)")
 
             # Show loading animation if OLED is available
             if self.display_mode == "OLED" and self.oled_display.has_animations:
-                import threading
-
                 # Loading progress tracking
                 loading_done = threading.Event()
                 loading_progress = [0.0]  # Mutable container for progress
@@ -749,6 +1057,7 @@ class VoiceLCDv2:
                 def animate_loading():
                     """Animate loading while model loads"""
                     start_time = time.time()
+                    regulator = FrameRegulator(1 / 20)
                     while not loading_done.is_set():
                         # Estimate progress based on time (30 seconds typical)
                         elapsed = time.time() - start_time
@@ -764,7 +1073,7 @@ class VoiceLCDv2:
                             stage = "FINALIZING"
 
                         self.oled_display.show_loading(progress, stage)
-                        time.sleep(0.05)  # 20 FPS
+                        regulator.wait()  # 20 FPS
 
                     # Show 100% complete
                     self.oled_display.show_loading(1.0, "READY")
@@ -775,17 +1084,17 @@ class VoiceLCDv2:
                 anim_thread.start()
 
                 # Load model (blocking)
-                self.model = vosk.Model(model_path)
+                self.model = self.wait_for_model(model_path)
 
                 # Signal animation complete
                 loading_done.set()
                 anim_thread.join(timeout=1.0)
             else:
                 # No animation - direct load
-                self.model = vosk.Model(model_path)
+                self.model = self.wait_for_model(model_path)
 
-            hw = self.config["hardware"]
-            self.rec = vosk.KaldiRecognizer(self.model, hw["audio_sample_rate"])
+            import vosk
+            self.rec = vosk.KaldiRecognizer(self.model, self.sample_rate)
             self.has_speech = True
             self.log_hardware("Speech recognition ready!")
         except Exception as e:
@@ -804,9 +1113,9 @@ class VoiceLCDv2:
         
         # State tracking
         self.silence_start_time = None
-        self.last_reset_time = time.time()
+        self.last_reset_time = time.monotonic()
         self.consecutive_silence_chunks = 0
-        self.recent_transcriptions = []
+        self.recent_transcriptions = deque(maxlen=self.text_buffer_size)  # Oldest fall off
         
         if self.ring_buffer_enabled:
             self.log("Ring buffer enabled - audio processing delays will be minimized")
@@ -816,8 +1125,12 @@ class VoiceLCDv2:
     def calculate_audio_rms(self, audio_data):
         """Calculate RMS (Root Mean Square) of audio data to detect silence"""
         try:
-            # Convert bytes to array of 16-bit integers
-            audio_array = array.array('h', audio_data)
+            if HAS_AUDIOOP:
+                # Whole chunk reduced in one C call (sample width 2 bytes)
+                return audioop.rms(audio_data, 2) / 32768.0
+            
+            # View the bytes as 16-bit samples in place (no copy)
+            audio_array = memoryview(audio_data).cast('h')
 
             # Calculate RMS
             sum_squares = sum(sample * sample for sample in audio_array)
@@ -825,7 +1138,7 @@ class VoiceLCDv2:
 
             # Normalize to 0-1 range (assuming 16-bit audio)
             return rms / 32768.0
-        except (struct.error, ValueError, ZeroDivisionError) as e:
+        except (TypeError, ValueError, ZeroDivisionError, _AUDIO_ERROR) as e:
             self.log_transcription(f"Warning: Audio RMS calculation failed: {e}")
             return 0.0
     
@@ -834,33 +1147,28 @@ class VoiceLCDv2:
         if not self.ring_buffer_enabled:
             return False
         
-        current_time = time.time()
-        is_silence = audio_rms < self.silence_threshold
+        # Monotonic: the Pi has no RTC, so NTP can step time.time() at boot
+        current_time = time.monotonic()
         
-        if is_silence:
-            if self.silence_start_time is None:
+        if audio_rms < self.silence_threshold:
+            silence_start = self.silence_start_time
+            if silence_start is None:
                 self.silence_start_time = current_time
-            
-            silence_duration = current_time - self.silence_start_time
-            if silence_duration >= self.silence_duration:
+            elif current_time - silence_start >= self.silence_duration:
                 return True
         else:
             # Reset silence tracking when sound is detected
             self.silence_start_time = None
         
         # Force reset if max interval exceeded
-        time_since_reset = current_time - self.last_reset_time
-        if time_since_reset >= self.max_reset_interval:
-            return True
-        
-        return False
+        return current_time - self.last_reset_time >= self.max_reset_interval
     
     def reset_speech_recognizer(self):
         """Reset the Vosk recognizer to clear audio buffer"""
         if self.has_speech:
             try:
                 self.rec.Reset()
-                self.last_reset_time = time.time()
+                self.last_reset_time = time.monotonic()
                 self.silence_start_time = None
                 self.log_transcription("Speech recognizer reset - audio buffer cleared")
                 return True
@@ -874,7 +1182,7 @@ class VoiceLCDv2:
         if not self.ring_buffer_enabled:
             return {"status": "disabled"}
         
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_reset = current_time - self.last_reset_time
         
         stats = {
@@ -892,6 +1200,18 @@ class VoiceLCDv2:
 
         return stats
 
+    def init_vad_gate(self):
+        """Initialize the energy gate that keeps quiet audio away from Vosk"""
+        vad_config = self.config.get("voice", {}).get("vad", {})
+
+        self.vad_enabled = vad_config.get("enabled", False)
+        self.vad_threshold = vad_config.get("threshold", 0.01)
+        self.vad_hangover = vad_config.get("hangover_seconds", 1.5)
+        self.vad_preroll_chunks = vad_config.get("preroll_chunks", 2)
+
+        if self.vad_enabled:
+            self.log(f"VAD gate enabled - skipping decode below {self.vad_threshold} after {self.vad_hangover}s")
+
     def init_follow_up_mode(self):
         """Initialize follow-up mode state variables"""
         followup_config = self.config.get("voice", {}).get("follow_up_mode", {})
@@ -962,11 +1282,7 @@ class VoiceLCDv2:
             return
             
         if self.display_mode == "LCD":
-            cols = self.config["hardware"]["lcd_cols"]
-            self.lcd.cursor_pos = (0, 0)
-            self.lcd.write_string(line1[:cols].ljust(cols))
-            self.lcd.cursor_pos = (1, 0)
-            self.lcd.write_string(line2[:cols].ljust(cols))
+            self._screen.write_lines(line1, line2)
         elif self.display_mode == "OLED":
             # Format for OLED display
             combined_text = f"{line1} {line2}".strip()
@@ -991,72 +1307,91 @@ class VoiceLCDv2:
             if duration:
                 time.sleep(duration)
             else:
-                time.sleep(self.config["display"].get("heard_text_cycles", 2) * 2)
+                time.sleep(self.heard_text_cycles * 2)
             return
         
         # LCD scrolling behavior
-        cols = self.config["hardware"]["lcd_cols"]
-        speed = self.config["display"]["scroll_speed"]
-        cycles = cycles or self.config["display"].get("heard_text_cycles", 2)
+        cols = self.cols
+        speed = self.scroll_speed
+        cycles = cycles or self.heard_text_cycles
+        
+        frames = scroll_frames(text, cols)
         
-        padded = " " * cols + text + " " * cols
+        # Bind hot names once - the loops below run hundreds of frames
+        display_text = self.display_text
+        monotonic = time.monotonic
+        # Pace on a fixed schedule so I2C write time doesn't stretch each frame
+        wait = FrameRegulator(speed).wait
+        
+        # Pick the row layout once rather than testing `line` every frame
+        if self.display_mode == "LCD":
+            # Frames are already cols wide: draw the fixed row once, then
+            # hand frames straight to the row writer without re-padding
+            fixed_row, label = (1, "") if line == 1 else (0, "" if duration else "Heard:")
+            self._screen.write_line(fixed_row, self._screen.fit(label))
+            emit = partial(self._screen.write_line, 1 - fixed_row)
+        elif line == 1:
+            emit = partial(display_text, line2="")
+        else:
+            emit = partial(display_text, "" if duration else "Heard:")
         
         if duration:
             # Time-based scrolling
-            start_time = time.time()
-            while time.time() - start_time < duration:
-                for i in range(len(padded) - cols + 1):
-                    if time.time() - start_time >= duration:
-                        break
-                    if line == 1:
-                        self.display_text(padded[i:i+cols], "")
-                    else:
-                        self.display_text("", padded[i:i+cols])
-                    time.sleep(speed)
+            deadline = monotonic() + duration
+            for frame in cycle(frames):
+                if monotonic() >= deadline:
+                    break
+                emit(frame)
+                wait()
         else:
             # Cycle-based scrolling
-            for cycle in range(cycles):
-                for i in range(len(padded) - cols + 1):
-                    if line == 1:
-                        self.display_text(padded[i:i+cols], "")
-                    else:
-                        self.display_text("Heard:", padded[i:i+cols])
-                    time.sleep(speed)
+            for frame in chain.from_iterable(repeat(frames, cycles)):
+                emit(frame)
+                wait()
             
-            # Show static view briefly
+            # Show static view briefly (the frame where the text sits flush left)
             if line == 2:
-                self.display_text("Heard:", text[:cols])
+                display_text("Heard:", frames[cols])
                 time.sleep(1)
     
+    # Every supported variable in one pattern, so text is scanned once
+    _VAR_RE = re.compile(r'\{random_(\d+)_(\d+)\}|\{(ip|time|date)\}')
+    _CLOCK_FORMATS = {'time': "%H:%M:%S", 'date': "%m/%d/%y"}
+    
     def substitute_variables(self, text):
         """Replace variables in text with actual values"""
-        # Random numbers
-        text = re.sub(r'\{random_(\d+)_(\d+)\}', 
-                     lambda m: str(random.randint(int(m.group(1)), int(m.group(2)))), text)
+        if '{' not in text:
+            return text  # No variables - the common case for command text
         
-        # IP address
-        if '{ip}' in text:
-            text = text.replace('{ip}', self.get_ip())
+        now = None  # One clock read serves both {time} and {date}
         
-        # Current time/date
-        if '{time}' in text:
-            text = text.replace('{time}', datetime.now().strftime("%H:%M:%S"))
-        if '{date}' in text:
-            text = text.replace('{date}', datetime.now().strftime("%m/%d/%y"))
+        def replace(match):
+            nonlocal now
+            name = match.group(3)
+            if name is None:
+                return _sub_random(match)
+            if name == 'ip':
+                return self.get_ip()
+            if now is None:
+                now = datetime.now()
+            return now.strftime(self._CLOCK_FORMATS[name])
         
-        return text
+        return self._VAR_RE.sub(replace, text)
     
     def get_ip(self):
-        """Get Pi's IP address"""
-        try:
-            result = subprocess.run(['hostname', '-I'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0 and result.stdout.strip():
-                return result.stdout.strip().split()[0]
-        except (subprocess.TimeoutExpired, FileNotFoundError, IndexError) as e:
-            self.log_command(f"Warning: Could not get IP address: {e}")
-        except Exception as e:
-            self.log_command(f"Unexpected error getting IP: {e}")
-        return "No Network"
+        """Get Pi's IP address (cached for ip_cache_ttl seconds)"""
+        ip, stamp = self._ip_cache
+        now = time.monotonic()
+        if ip and now - stamp < self.ip_cache_ttl:
+            return ip
+        
+        ip = get_ip_address()
+        if ip is None:
+            self.log_command("Warning: Could not get IP address: no IPv4 interface")
+            return "No Network"
+        
+        self._ip_cache = (ip, now)
+        return ip
     
     def get_log_info(self):
         """Get information about current log files"""
@@ -1076,6 +1411,12 @@ class VoiceLCDv2:
     def clean_logs(self):
         """Force log rotation and cleanup"""
         try:
+            if self._log_file_handler:
+                # Hold the handler lock so the log writer thread can't
+                # write mid-rollover
+                with self._log_file_handler.lock:
+                    self._log_file_handler.doRollover()
+                return "Logs rotated"
             if self.logger and hasattr(self.logger, 'handlers'):
                 for handler in self.logger.handlers:
                     if hasattr(handler, 'doRollover'):
@@ -1086,19 +1427,39 @@ class VoiceLCDv2:
             return f"Error: {str(e)[:20]}"
     
     def get_system_health(self):
-        """Get system health information"""
+        """Get system health information (cached for health_cache_ttl seconds)"""
+        health, stamp = self._health_cache
+        now = time.monotonic()
+        if health and now - stamp < self.health_cache_ttl:
+            return health
+        
+        health = self._read_system_health()
+        if "error" not in health:
+            self._health_cache = (health, now)
+        return health
+    
+    def _read_system_health(self):
+        """Read disk and memory usage from the system"""
         try:
-            # Disk usage
-            disk = shutil.disk_usage("/")
-            used_percent = (disk.used / disk.total) * 100
-            free_gb = disk.free / (1024**3)
+            # Disk usage, straight from statvfs (what shutil.disk_usage wraps)
+            st = os.statvfs("/")
+            used_percent = (st.f_blocks - st.f_bfree) / st.f_blocks * 100
+            free_gb = st.f_bavail * st.f_frsize / (1024**3)
             
             # Memory info (if available on Linux)
             try:
+                # Single pass; both fields sit near the top of the file
+                mem_total = mem_free = None
                 with open('/proc/meminfo', 'r') as f:
-                    meminfo = f.read()
-                mem_total = int([line for line in meminfo.split('\n') if 'MemTotal' in line][0].split()[1]) // 1024
-                mem_free = int([line for line in meminfo.split('\n') if 'MemAvailable' in line][0].split()[1]) // 1024
+                    for line in f:
+                        if line.startswith('MemTotal:'):
+                            mem_total = int(line.split()[1]) // 1024
+                        elif line.startswith('MemAvailable:'):
+                            mem_free = int(line.split()[1]) // 1024
+                        if mem_total is not None and mem_free is not None:
+                            break
+                if mem_total is None or mem_free is None:
+                    raise ValueError("MemTotal/MemAvailable missing from /proc/meminfo")
                 mem_used = mem_total - mem_free
                 mem_percent = (mem_used / mem_total) * 100
 
@@ -1119,177 +1480,188 @@ class VoiceLCDv2:
     
     def execute_action(self, action_type, command_config, command_text=""):
         """Execute different types of actions"""
-        if action_type == "show_ip":
-            ip = self.get_ip()
-            fmt = command_config.get("display_format", ["IP Address:", "{ip}"])
-            self.display_text(fmt[0], self.substitute_variables(fmt[1]))
-            time.sleep(self.config["display"]["command_result_time"])
-        
-        elif action_type == "show_time":
-            now = datetime.now()
-            time_fmt = command_config.get("time_format", "%H:%M:%S")
-            date_fmt = command_config.get("date_format", "%m/%d/%y")
-            self.display_text(now.strftime(time_fmt), now.strftime(date_fmt))
-            time.sleep(self.config["display"]["command_result_time"])
-        
-        elif action_type == "tell_joke":
-            jokes = self.config["messages"]["jokes"]
-            joke = random.choice(jokes)
-            duration = command_config.get("scroll_duration", 8)
-            self.scroll_text(joke, line=1, duration=duration)
-        
-        elif action_type == "custom_message":
-            message = self.substitute_variables(command_config["message"])
-            duration = command_config.get("scroll_duration", 5)
-            if len(message) <= self.config["hardware"]["lcd_cols"]:
-                self.display_text(message, "")
-                time.sleep(duration)
+        action = self._actions.get(action_type)
+        if action:
+            action(command_config, command_text)
+    
+    def _act_show_ip(self, command_config, command_text=""):
+        """Show the Pi's IP address"""
+        fmt = command_config.get("display_format", ["IP Address:", "{ip}"])
+        self.display_text(fmt[0], self.substitute_variables(fmt[1]))
+        time.sleep(self.cmd_result_time)
+    
+    def _act_show_time(self, command_config, command_text=""):
+        """Show the current time and date"""
+        now = datetime.now()
+        time_fmt = command_config.get("time_format", "%H:%M:%S")
+        date_fmt = command_config.get("date_format", "%m/%d/%y")
+        self.display_text(now.strftime(time_fmt), now.strftime(date_fmt))
+        time.sleep(self.cmd_result_time)
+    
+    def _act_tell_joke(self, command_config, command_text=""):
+        """Scroll a random joke"""
+        jokes = self.config["messages"]["jokes"]
+        joke = random.choice(jokes)
+        duration = command_config.get("scroll_duration", 8)
+        self.scroll_text(joke, line=1, duration=duration)
+    
+    def _act_custom_message(self, command_config, command_text=""):
+        """Show or scroll a configured message"""
+        message = self.substitute_variables(command_config["message"])
+        duration = command_config.get("scroll_duration", 5)
+        if len(message) <= self.cols:
+            self.display_text(message, "")
+            time.sleep(duration)
+        else:
+            self.scroll_text(message, line=1, duration=duration)
+    
+    def _act_run_command(self, command_config, command_text=""):
+        """Run a shell command and display its output"""
+        import subprocess
+        try:
+            cmd = command_config["command"]
+            timeout = command_config.get("timeout", None)  # Optional timeout in seconds
+            show_errors = command_config.get("show_errors", True)
+
+            self.log_command(f"Running command: {cmd[:50]}...")
+
+            # Run command with optional timeout (output bounded at the pipe)
+            returncode, stdout, stderr = run_shell_head(cmd, timeout)
+
+            # Check if command succeeded
+            if returncode == 0:
+                output = stdout.strip()[:50]  # Limit output length
+                self.log_command(f"Command succeeded: {output[:30]}")
             else:
-                self.scroll_text(message, line=1, duration=duration)
-        
-        elif action_type == "run_command":
-            try:
-                cmd = command_config["command"]
-                timeout = command_config.get("timeout", None)  # Optional timeout in seconds
-                show_errors = command_config.get("show_errors", True)
-
-                self.log_command(f"Running command: {cmd[:50]}...")
-
-                # Run command with optional timeout
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout
-                )
-
-                # Check if command succeeded
-                if result.returncode == 0:
-                    output = result.stdout.strip()[:50]  # Limit output length
-                    self.log_command(f"Command succeeded: {output[:30]}")
-                else:
-                    # Command failed - show stderr if enabled
-                    if show_errors and result.stderr:
-                        output = result.stderr.strip()[:50]
-                        self.log_command(f"Command failed (exit {result.returncode}): {output[:30]}")
-                    else:
-                        output = result.stdout.strip()[:50] or f"Error (exit {result.returncode})"
-                        self.log_command(f"Command failed with exit code {result.returncode}")
-
-                # Format display output
-                fmt = command_config.get("display_format", ["Output:", "{output}"])
-                line1 = fmt[0] if len(fmt) > 0 else "Output:"
-                line2 = fmt[1].replace("{output}", output) if len(fmt) > 1 else output
-
-                # Display result
-                if len(line2) <= self.config["hardware"]["lcd_cols"]:
-                    self.display_text(line1, line2)
-                    time.sleep(self.config["display"]["command_result_time"])
+                # Command failed - show stderr if enabled
+                if show_errors and stderr:
+                    output = stderr.strip()[:50]
+                    self.log_command(f"Command failed (exit {returncode}): {output[:30]}")
                 else:
-                    self.display_text(line1, "")
-                    time.sleep(0.5)
-                    self.scroll_text(line2, line=2, cycles=2)
-
-            except subprocess.TimeoutExpired:
-                error_msg = f"Timeout ({timeout}s)"
-                self.log_command(f"Command timed out after {timeout} seconds")
-                self.display_text("Command Error:", error_msg)
-                time.sleep(3)
-            except FileNotFoundError as e:
-                error_msg = "Script not found"
-                self.log_command(f"Command not found: {cmd}")
-                self.display_text("Command Error:", error_msg)
-                time.sleep(3)
-            except Exception as e:
-                error_msg = str(e)[:16]
-                self.log_command(f"Command exception: {e}")
-                self.display_text("Command Error:", error_msg)
-                time.sleep(3)
-        
-        elif action_type == "show_log_info":
-            log_info = self.get_log_info()
-            fmt = command_config.get("display_format", ["Log Status:", "{info}"])
-            self.display_text(fmt[0], log_info)
-            time.sleep(self.config["display"]["command_result_time"])
-            # Also print detailed info to console
-            if self.logger:
-                print(f"Log file details: {log_info}")
-        
-        elif action_type == "clean_logs":
-            fmt = command_config.get("display_format", ["Cleaning logs", "Please wait..."])
-            self.display_text(fmt[0], fmt[1])
-            result = self.clean_logs()
-            time.sleep(1)
-            self.display_text("Log Cleanup:", result)
-            time.sleep(self.config["display"]["command_result_time"])
-        
-        elif action_type == "system_health":
-            fmt = command_config.get("display_format", ["System Status:", "See details below"])
-            self.display_text(fmt[0], "Checking...")
-            health = self.get_system_health()
+                    output = stdout.strip()[:50] or f"Error (exit {returncode})"
+                    self.log_command(f"Command failed with exit code {returncode}")
+
+            # Format display output
+            fmt = command_config.get("display_format", ["Output:", "{output}"])
+            line1 = fmt[0] if len(fmt) > 0 else "Output:"
+            line2 = fmt[1].replace("{output}", output) if len(fmt) > 1 else output
+
+            # Display result
+            if len(line2) <= self.cols:
+                self.display_text(line1, line2)
+                time.sleep(self.cmd_result_time)
+            else:
+                self.display_text(line1, "")
+                time.sleep(0.5)
+                self.scroll_text(line2, line=2, cycles=2)
+
+        except subprocess.TimeoutExpired:
+            error_msg = f"Timeout ({timeout}s)"
+            self.log_command(f"Command timed out after {timeout} seconds")
+            self.display_text("Command Error:", error_msg)
+            time.sleep(3)
+        except FileNotFoundError as e:
+            error_msg = "Script not found"
+            self.log_command(f"Command not found: {cmd}")
+            self.display_text("Command Error:", error_msg)
+            time.sleep(3)
+        except Exception as e:
+            error_msg = str(e)[:16]
+            self.log_command(f"Command exception: {e}")
+            self.display_text("Command Error:", error_msg)
+            time.sleep(3)
+    
+    def _act_show_log_info(self, command_config, command_text=""):
+        """Show log file status"""
+        log_info = self.get_log_info()
+        fmt = command_config.get("display_format", ["Log Status:", "{info}"])
+        self.display_text(fmt[0], log_info)
+        time.sleep(self.cmd_result_time)
+        # Also print detailed info to console
+        if self.logger:
+            print(f"Log file details: {log_info}")
+    
+    def _act_clean_logs(self, command_config, command_text=""):
+        """Force a log rotation"""
+        fmt = command_config.get("display_format", ["Cleaning logs", "Please wait..."])
+        self.display_text(fmt[0], fmt[1])
+        result = self.clean_logs()
+        time.sleep(1)
+        self.display_text("Log Cleanup:", result)
+        time.sleep(self.cmd_result_time)
+    
+    def _act_system_health(self, command_config, command_text=""):
+        """Show disk usage and print a health report"""
+        fmt = command_config.get("display_format", ["System Status:", "See details below"])
+        self.display_text(fmt[0], "Checking...")
+        health = self.get_system_health()
+        
+        if "error" in health:
+            self.display_text("System Error:", health["error"])
+        else:
+            # Show disk usage on LCD
+            disk_line = f"Disk: {health['disk_used_percent']:.0f}% used"
+            free_line = f"Free: {health['disk_free_gb']:.1f}GB"
+            self.display_text(disk_line, free_line)
+            
+            # Print detailed info to console
+            print(f"=== System Health ===")
+            print(f"Disk Usage: {health['disk_used_percent']:.1f}% used")
+            print(f"Free Space: {health['disk_free_gb']:.2f} GB")
+            if "memory_used_percent" in health:
+                print(f"Memory Usage: {health['memory_used_percent']:.1f}%")
+                print(f"Memory Used: {health['memory_used_mb']} MB")
             
-            if "error" in health:
-                self.display_text("System Error:", health["error"])
+            # Ring buffer stats
+            ring_stats = self.get_ring_buffer_stats()
+            print(f"\n=== Ring Buffer Status ===")
+            if ring_stats["status"] == "enabled":
+                print(f"Status: Enabled - Preventing audio delays")
+                print(f"Time since last reset: {ring_stats['time_since_last_reset']}s")
+                print(f"Recent transcriptions: {ring_stats['recent_transcriptions_count']}")
+                if ring_stats["is_currently_silent"]:
+                    print(f"Currently silent for: {ring_stats.get('current_silence_duration', 0)}s")
             else:
-                # Show disk usage on LCD
-                disk_line = f"Disk: {health['disk_used_percent']:.0f}% used"
-                free_line = f"Free: {health['disk_free_gb']:.1f}GB"
-                self.display_text(disk_line, free_line)
-                
-                # Print detailed info to console
-                print(f"=== System Health ===")
-                print(f"Disk Usage: {health['disk_used_percent']:.1f}% used")
-                print(f"Free Space: {health['disk_free_gb']:.2f} GB")
-                if "memory_used_percent" in health:
-                    print(f"Memory Usage: {health['memory_used_percent']:.1f}%")
-                    print(f"Memory Used: {health['memory_used_mb']} MB")
-                
-                # Ring buffer stats
-                ring_stats = self.get_ring_buffer_stats()
-                print(f"\n=== Ring Buffer Status ===")
-                if ring_stats["status"] == "enabled":
-                    print(f"Status: Enabled - Preventing audio delays")
-                    print(f"Time since last reset: {ring_stats['time_since_last_reset']}s")
-                    print(f"Recent transcriptions: {ring_stats['recent_transcriptions_count']}")
-                    if ring_stats["is_currently_silent"]:
-                        print(f"Currently silent for: {ring_stats.get('current_silence_duration', 0)}s")
-                else:
-                    print(f"Status: Disabled - Using standard processing")
-                
-                # Check thresholds and warn
-                log_config = self.config.get("logging", {})
-                threshold = log_config.get("maintenance", {}).get("disk_space_warning_threshold_percent", 90)
-                if health["disk_used_percent"] > threshold:
-                    print(f"WARNING: Disk usage above {threshold}%!")
+                print(f"Status: Disabled - Using standard processing")
             
-            time.sleep(self.config["display"]["command_result_time"])
+            # Check thresholds and warn
+            log_config = self.config.get("logging", {})
+            threshold = log_config.get("maintenance", {}).get("disk_space_warning_threshold_percent", 90)
+            if health["disk_used_percent"] > threshold:
+                print(f"WARNING: Disk usage above {threshold}%!")
         
-        elif action_type == "clear_display":
-            if self.has_display:
-                self.lcd.clear()
-            time.sleep(1)
+        time.sleep(self.cmd_result_time)
     
-    def find_matching_command(self, text):
+    def _act_clear_display(self, command_config, command_text=""):
+        """Clear the display"""
+        if self.has_display:
+            self.lcd.clear()
+            self._screen.mark_cleared()
+        time.sleep(1)
+    
+    def find_matching_command(self, text, text_lower=None):
         """Find command that matches the spoken text"""
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for command_name, command_config in self.config["commands"].items():
-            # Check main command name
-            if command_name in text_lower:
-                return command_name, command_config
-            
-            # Check aliases
-            aliases = command_config.get("aliases", [])
-            for alias in aliases:
-                if alias.lower() in text_lower:
-                    return command_name, command_config
+        if self._alias_automaton is not None:
+            # One scan finds every alias present; the earliest-configured wins
+            best = min((payload for _, payload in self._alias_automaton.iter(text_lower)),
+                       default=None, key=lambda payload: payload[0])
+            return best[1] if best else (None, None)
+        
+        # Aliases can be multi-word phrases, so match by substring
+        for token, entry in self._alias_index.items():
+            if token in text_lower:
+                return entry
         
         return None, None
     
-    def handle_command(self, text):
-        """Process recognized speech"""
+    def handle_command(self, text, text_lower=None):
+        """Process recognized speech (text_lower: text.lower(), if already computed)"""
         text = text.strip()
+        if text_lower is None:
+            text_lower = text.lower()
         self.log_command(f"Processing: '{text}'")
         
         # Show processing status for OLED
@@ -1300,14 +1672,11 @@ class VoiceLCDv2:
                 self.oled_display.show_status("Voice: Processing")
         
         # Add to history
-        if self.config["advanced"].get("enable_command_history", False):
+        if self.history_enabled:
             self.command_history.append((datetime.now(), text))
-            max_history = self.config["advanced"].get("max_command_history", 50)
-            if len(self.command_history) > max_history:
-                self.command_history.pop(0)
         
         # Find matching command
-        command_name, command_config = self.find_matching_command(text)
+        command_name, command_config = self.find_matching_command(text, text_lower)
         
         if command_config:
             self.log_command(f"Executing command: {command_name}")
@@ -1351,6 +1720,112 @@ class VoiceLCDv2:
             else:
                 self.oled_display.show_status("Voice: Ready")
     
+    def has_wake_word(self, text_lower):
+        """Check lowercased text for any configured wake word"""
+        return (not self._wake_set.isdisjoint(text_lower.split())
+                or any(phrase in text_lower for phrase in self._wake_phrases))
+    
+    def show_wake_feedback(self):
+        """Acknowledge a wake word heard mid-utterance"""
+        if self.display_mode == "OLED":
+            if self.oled_display.has_animations:
+                self.oled_display.show_status_enhanced("LISTENING")
+            else:
+                self.oled_display.show_status("Voice: Listening")
+        else:
+            self.display_text("Listening...", "")
+    
+    def _decode_audio(self, audio_buf, audio_ready, chunk_size, events, stop):
+        """Decoder thread: feed Vosk and queue finished utterances"""
+        wake_latched = False  # Wake word already reported for this utterance
+        reset_due = False  # Ring-buffer reset waiting for the utterance to end
+
+        def decode(data):
+            nonlocal wake_latched, reset_due
+            if self.rec.AcceptWaveform(data):
+                wake_latched = False
+                try:
+                    events.put_nowait(("final", self.rec.Result()))
+                except queue.Full:
+                    self.log_transcription("Warning: transcription queue full - utterance dropped")
+                if reset_due:
+                    reset_due = False
+                    self.reset_speech_recognizer()
+            elif self.early_wake_feedback and not wake_latched:
+                # Spot the wake word in the running partial so feedback
+                # doesn't wait for Vosk to detect the end of the utterance
+                partial = extract_text(self.rec.PartialResult(), "partial")
+                if partial and self.has_wake_word(partial.lower()):
+                    wake_latched = True
+                    try:
+                        events.put_nowait(("wake", partial))
+                    except queue.Full:
+                        pass
+
+        # VAD gate: after hangover_chunks of quiet (enough for Vosk to see the
+        # utterance end), stop decoding; the last few quiet chunks are kept
+        # and replayed when speech resumes so word onsets aren't clipped
+        hangover_chunks = max(1, round(self.vad_hangover * self.sample_rate / chunk_size))
+        preroll = deque(maxlen=self.vad_preroll_chunks)
+        quiet_chunks = hangover_chunks
+
+        # Settings are fixed while listening: bind them once so each chunk
+        # tests locals instead of re-reading instance attributes
+        ring_buffer = self.ring_buffer_enabled
+        vad_enabled = self.vad_enabled
+        vad_threshold = self.vad_threshold
+        audio_rms_of = self.calculate_audio_rms
+        should_reset = self.should_reset_recognizer
+        next_chunk = audio_buf.popleft
+        overruns_seen = 0
+
+        try:
+            while not stop.is_set():
+                try:
+                    data = next_chunk()
+                except IndexError:
+                    # Drained: sleep until the callback signals more audio.
+                    # Clearing before the next pop can't lose a chunk - any
+                    # appended after this clear sets the event again
+                    audio_ready.wait(0.5)
+                    audio_ready.clear()
+                    continue
+
+                if self.audio_overruns != overruns_seen:
+                    overruns_seen = self.audio_overruns
+                    self.log_transcription(f"Warning: decoder fell behind - {overruns_seen} audio chunks dropped so far")
+
+                # Calculate audio level for visualization
+                audio_rms = audio_rms_of(data)
+                self.audio_level = audio_rms
+
+                # Ring buffer: Check for reset, but never throw away a
+                # hypothesis Vosk is still building - defer to its final
+                if ring_buffer and not reset_due:
+                    if should_reset(audio_rms):
+                        if extract_text(self.rec.PartialResult(), "partial"):
+                            reset_due = True
+                        else:
+                            self.reset_speech_recognizer()
+                            wake_latched = False
+
+                if vad_enabled:
+                    if audio_rms >= vad_threshold:
+                        for lead_in in preroll:
+                            decode(lead_in)
+                        preroll.clear()
+                        quiet_chunks = 0
+                    else:
+                        quiet_chunks += 1
+                        if quiet_chunks > hangover_chunks:
+                            preroll.append(data)
+                            continue
+
+                decode(data)
+        except Exception as e:
+            if not stop.is_set():
+                events.put(("error", e))
+    
     def listen(self):
         """Main listening loop"""
         if not self.has_speech:
@@ -1373,49 +1848,77 @@ class VoiceLCDv2:
                 time.sleep(1)
         self.display_text(startup[0], startup[1])
         
-        # Audio setup
-        hw = self.config["hardware"] 
+        # PortAudio delivers chunks from its own thread via the callback, so
+        # no Python loop spins on stream.read. A decoder thread feeds Vosk,
+        # and both carry on while this thread is busy scrolling the display.
+        # Chunks go through a bounded deque: append is atomic and drops the
+        # oldest chunk when full, so the callback never waits on a lock held
+        # by the decoder and latency stays bounded.
+        chunk_size = self.chunk_size
+        audio_buf = deque(maxlen=8)
+        audio_ready = threading.Event()
+        events = queue.Queue(maxsize=32)
+        stop_capture = threading.Event()
+        self.audio_level = 0.0
+        self.audio_overruns = 0
+        
+        def on_audio(in_data, frame_count, time_info, status):
+            if len(audio_buf) == audio_buf.maxlen:
+                self.audio_overruns += 1  # Oldest chunk is about to fall off
+            audio_buf.append(in_data)
+            audio_ready.set()
+            return (None, pyaudio.paContinue)
+        
+        # Audio setup (module loaded by setup_speech)
+        pyaudio = self._pyaudio
         audio = pyaudio.PyAudio()
         stream = audio.open(format=pyaudio.paInt16, channels=1, 
-                          rate=hw["audio_sample_rate"], input=True,
-                          frames_per_buffer=hw["audio_chunk_size"])
+                          rate=self.sample_rate, input=True,
+                          frames_per_buffer=chunk_size,
+                          stream_callback=on_audio)
         
-        wake_words = self.config["voice"]["wake_words"]
         show_all = self.config["voice"]["show_all_transcriptions"]
         
-        self.log(f"Listening for wake words: {', '.join(wake_words)}")
+        self.log(f"Listening for wake words: {', '.join(self.wake_words)}")
 
-        # Initialize frame counter for audio viz updates
-        frame_count = 0
-        audio_update_interval = 2  # Update audio viz every N frames (reduce CPU)
+        audio_update_interval = 2  # Update audio viz every N chunks (reduce CPU)
+        
+        decoder = threading.Thread(target=self._decode_audio,
+                                   args=(audio_buf, audio_ready, chunk_size, events, stop_capture),
+                                   daemon=True)
+        decoder.start()
+        
+        # Idle wake-ups pace the follow-up timeout check and audio viz
+        idle_tick = chunk_size / self.sample_rate * audio_update_interval
 
         try:
             while True:
-                data = stream.read(hw["audio_chunk_size"], exception_on_overflow=False)
-
-                # Calculate audio level for visualization
-                audio_rms = self.calculate_audio_rms(data)
+                try:
+                    kind, payload = events.get(timeout=idle_tick)
+                except queue.Empty:
+                    kind = None
 
                 # Follow-up mode: Check for timeout
                 if self.followup_enabled:
                     self.check_follow_up_timeout()
 
-                # Ring buffer: Check for reset
-                if self.ring_buffer_enabled:
-                    if self.should_reset_recognizer(audio_rms):
-                        self.reset_speech_recognizer()
-
-                # Update audio visualization periodically (OLED only)
-                if self.display_mode == "OLED" and self.oled_display.has_animations:
-                    frame_count += 1
-                    if frame_count % audio_update_interval == 0:
+                if kind is None:
+                    # Update audio visualization periodically (OLED only)
+                    if self.display_mode == "OLED" and self.oled_display.has_animations:
                         # Show different status in follow-up mode
                         status = "FOLLOW-UP" if self.followup_mode == "FOLLOW_UP" else "READY"
-                        self.oled_display.show_audio_visualization(audio_rms, status=status)
+                        self.oled_display.show_audio_visualization(self.audio_level, status=status)
+                    continue
+                
+                if kind == "error":
+                    raise payload
+                
+                if kind == "wake":
+                    self.show_wake_feedback()
+                    continue
                 
-                if self.rec.AcceptWaveform(data):
-                    result = json.loads(self.rec.Result())
-                    text = result.get('text', '').strip()
+                if kind == "final":
+                    text = extract_text(payload).strip()
                     
                     if text:
                         # Ring buffer: Add to recent transcriptions buffer
@@ -1424,12 +1927,9 @@ class VoiceLCDv2:
                                 'text': text,
                                 'timestamp': time.time()
                             })
-                            # Trim buffer to max size
-                            if len(self.recent_transcriptions) > self.text_buffer_size:
-                                self.recent_transcriptions.pop(0)
                         
                         # Log transcription if enabled
-                        if self.config.get("logging", {}).get("component_logs", {}).get("transcription", {}).get("enabled", True):
+                        if self.log_transcriptions:
                             self.log_transcription(f"Transcribed: '{text}'")
                         
                         if show_all:
@@ -1444,13 +1944,13 @@ class VoiceLCDv2:
                                     self.oled_display.show_status("Voice: Heard")
                                     time.sleep(0.2)
                                     self.oled_display.show_transcription(text)
-                                time.sleep(self.config["display"]["short_text_display_time"])
+                                time.sleep(self.short_text_time)
                             else:
                                 # LCD behavior
-                                cols = self.config["hardware"]["lcd_cols"]
+                                cols = self.cols
                                 if len(text) <= cols:
                                     self.display_text("Heard:", text)
-                                    time.sleep(self.config["display"]["short_text_display_time"])
+                                    time.sleep(self.short_text_time)
                                 else:
                                     self.display_text("Heard:", "")
                                     time.sleep(0.5)
@@ -1458,7 +1958,7 @@ class VoiceLCDv2:
                         
                         # Check for wake words
                         text_lower = text.lower()
-                        wake_detected = any(wake_word in text_lower for wake_word in wake_words)
+                        wake_detected = self.has_wake_word(text_lower)
 
                         # Handle command based on mode
                         if wake_detected:
@@ -1466,15 +1966,15 @@ class VoiceLCDv2:
                             if self.followup_mode == "FOLLOW_UP":
                                 self.log("Wake word detected - exiting follow-up mode")
                                 self.exit_follow_up_mode("wake word")
-                            self.handle_command(text)
+                            self.handle_command(text, text_lower)
                         elif self.followup_mode == "FOLLOW_UP":
                             # Follow-up mode: try to match command without wake word
                             self.log(f"Follow-up command attempt: '{text}'")
-                            command_name, command_config = self.find_matching_command(text)
+                            command_name, command_config = self.find_matching_command(text, text_lower)
 
                             if command_config:
                                 # Command matched! Process it
-                                self.handle_command(text)
+                                self.handle_command(text, text_lower)
                             else:
                                 # No match - increment error count
                                 self.followup_error_count += 1
@@ -1498,6 +1998,8 @@ class VoiceLCDv2:
         except KeyboardInterrupt:
             self.log("Stopped by user")
         finally:
+            stop_capture.set()
+            decoder.join(timeout=1.0)
             stream.stop_stream()
             stream.close() 
             audio.terminate()
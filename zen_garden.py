@@ -10,6 +10,8 @@ import signal
 import sys
 from datetime import datetime
 from typing import List, Tuple
+
+from pcf8574_writer import open_shadow_rows
 try:
     from RPLCD.i2c import CharLCD
     HAS_LCD = True
@@ -34,6 +36,9 @@ class ZenGarden:
                 self.has_display = False
         else:
             self.has_display = False
+        
+        # Row shadow: sends only changed cells, batched over I2C when possible
+        self._screen = open_shadow_rows(self.lcd, i2c_addr, cols, rows) if self.has_display else None
             
         self.scenes = [
             self.progress_bars,
@@ -65,6 +70,24 @@ class ZenGarden:
             "Inner calm"
         ]
         
+        # Fixed animations are built once; scenes just replay the frames
+        self._scroll_frames = self._build_scroll_frames("DIGITAL DISPLAY VIBES")
+        self._bounce_frames = self._build_bounce_frames()
+    
+    def _build_scroll_frames(self, message):
+        """(text, progress bar) frame pairs for smooth_scroll"""
+        cols = self.cols
+        padded = " " * cols + message + " " * cols
+        return [(padded[i:i + cols], "=" * (i % cols) + "-" * (cols - (i % cols)))
+                for i in range(len(padded) - cols + 1)]
+    
+    def _build_bounce_frames(self):
+        """(dot, floor) frame pairs for one bouncing_dot sweep"""
+        cols = self.cols
+        positions = list(range(cols)) + list(range(cols - 2, 0, -1))
+        floor = "-" * cols
+        return [(" " * pos + "*" + " " * (cols - pos - 1), floor) for pos in positions]
+        
     def display_text(self, line1: str = "", line2: str = ""):
         """Display text on LCD, centering if shorter than display width"""
         if not self.has_display:
@@ -75,15 +98,13 @@ class ZenGarden:
         line1 = line1[:self.cols].center(self.cols)
         line2 = line2[:self.cols].center(self.cols) if self.rows > 1 else ""
         
-        self.lcd.cursor_pos = (0, 0)
-        self.lcd.write_string(line1)
-        if self.rows > 1:
-            self.lcd.cursor_pos = (1, 0)
-            self.lcd.write_string(line2)
+        # Both rows' changes go out together as a single I2C transaction
+        self._screen.write_lines(line1, line2)
     
     def clear(self):
         if self.has_display:
             self.lcd.clear()
+            self._screen.mark_cleared()
         else:
             print("LCD: [CLEAR]")
     
@@ -101,11 +122,15 @@ class ZenGarden:
     def spectrum_analyzer(self):
         """Fake spectrum analyzer with blocks"""
         heights = [0] * 8  # 8 frequency bands for 16 chars
+        frames = 20
         
-        for frame in range(20):
+        # Draw every band's random steps for the whole scene in one call
+        deltas = iter(random.choices((-1, 0, 1, 2), k=frames * len(heights)))
+        
+        for frame in range(frames):
             # Random frequency data
             for i in range(8):
-                heights[i] = max(0, heights[i] + random.randint(-1, 2))
+                heights[i] = max(0, heights[i] + next(deltas))
                 if heights[i] > 2: heights[i] = 2
             
             # Build display
@@ -142,32 +167,26 @@ class ZenGarden:
     
     def smooth_scroll(self):
         """Smooth scrolling text"""
-        message = "DIGITAL DISPLAY VIBES"
-        padded = " " * self.cols + message + " " * self.cols
-        
-        for i in range(len(padded) - self.cols + 1):
-            line1 = padded[i:i + self.cols]
-            line2 = "=" * (i % self.cols) + "-" * (self.cols - (i % self.cols))
+        for line1, line2 in self._scroll_frames:
             self.display_text(line1, line2)
             time.sleep(0.25)
     
     def bouncing_dot(self):
         """Bouncing dot animation"""
-        positions = list(range(self.cols)) + list(range(self.cols - 2, 0, -1))
-        
         for cycle in range(2):
-            for pos in positions:
-                line1 = " " * pos + "*" + " " * (self.cols - pos - 1)
-                line2 = "-" * self.cols
+            for line1, line2 in self._bounce_frames:
                 self.display_text(line1, line2)
                 time.sleep(0.15)
     
     def level_meter(self):
         """VU meter style display"""
-        for frame in range(15):
-            # Random levels for left/right channels
-            left_level = random.randint(0, self.cols)
-            right_level = random.randint(0, self.cols)
+        frames = 15
+        # Random levels for left/right channels, drawn for the whole scene at once
+        levels = iter(random.choices(range(self.cols + 1), k=frames * 2))
+        
+        for frame in range(frames):
+            left_level = next(levels)
+            right_level = next(levels)
             
             # Build meter bars
             left_bar = "#" * left_level + "." * (self.cols - left_level)